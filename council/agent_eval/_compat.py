@@ -0,0 +1,18 @@
+"""
+Python version compatibility helpers for Agent Eval.
+"""
+
+import sys
+
+import yaml
+
+# dataclass(slots=True) only exists on Python 3.10+; on 3.9 the
+# decorated classes simply keep a per-instance __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# LibYAML-backed loader/dumper when PyYAML was built with it; the pure
+# Python classes parse the same documents, just more slowly.
+try:
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
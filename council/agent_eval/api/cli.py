@@ -133,19 +133,21 @@ def run_command(args):
     report = reporter.generate(results)
 
     # Output
-    if args.format == "json":
-        output = reporter.to_json(report)
-    elif args.format == "markdown":
-        output = reporter.to_markdown(report)
-    else:  # summary
-        output = reporter.to_summary(report)
-
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(output)
+        if args.format == "json":
+            reporter.to_json_file(report, args.output)
+        elif args.format == "markdown":
+            reporter.to_markdown_file(report, args.output)
+        else:  # summary
+            args.output.write_text(reporter.to_summary(report))
         print(f"\nReport saved to: {args.output}")
-    else:
-        print(output)
+    elif args.format == "json":
+        print(reporter.to_json(report))
+    elif args.format == "markdown":
+        print(reporter.to_markdown(report))
+    else:  # summary
+        print(reporter.to_summary(report))
 
     # Exit code based on results
     if report.errors > 0 or report.timeouts > 0:
@@ -10,15 +10,16 @@ Supports:
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import IO, Optional, Any, Dict, Union
 import os
 
 import yaml
 
+from ._compat import DATACLASS_SLOTS, YamlSafeDumper, YamlSafeLoader
 from .exceptions import ConfigurationError
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentConfig:
     """Configuration for the agent being tested."""
 
@@ -37,7 +38,7 @@ class AgentConfig:
             raise ConfigurationError("retry_delay_seconds must be positive")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WatchdogConfig:
     """Configuration for the watchdog evaluator (LLM that evaluates agent output)."""
 
@@ -53,7 +54,7 @@ class WatchdogConfig:
             raise ConfigurationError("temperature must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PersistenceConfig:
     """Configuration for result persistence."""
 
@@ -72,7 +73,7 @@ class PersistenceConfig:
             raise ConfigurationError("keep_history_days must be positive")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionConfig:
     """Configuration for execution environment."""
 
@@ -90,7 +91,7 @@ class ExecutionConfig:
             raise ConfigurationError("parallel_scenarios must be positive")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Config:
     """Master configuration for Agent Eval system.
 
@@ -129,11 +130,29 @@ class Config:
         if not path.exists():
             raise ConfigurationError(f"Config file not found: {path}")
 
+        with open(path, "rb") as f:
+            return cls.from_yaml_stream(f, source=str(path))
+
+    @classmethod
+    def from_yaml_stream(
+        cls, stream: Union[str, bytes, IO], source: str = "<stream>"
+    ) -> "Config":
+        """Load configuration from in-memory YAML or an open file.
+
+        Args:
+            stream: YAML text, bytes, or a readable file object
+            source: Name used in error messages
+
+        Returns:
+            Config instance
+
+        Raises:
+            ConfigurationError: If the YAML is invalid
+        """
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
+            data = yaml.load(stream, Loader=YamlSafeLoader) or {}
         except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML in {path}: {e}")
+            raise ConfigurationError(f"Invalid YAML in {source}: {e}")
 
         return cls._from_dict(data)
 
@@ -218,4 +237,4 @@ class Config:
 
     def to_yaml(self) -> str:
         """Serialize config to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False)
+        return yaml.dump(self.to_dict(), Dumper=YamlSafeDumper, default_flow_style=False)
@@ -5,9 +5,11 @@ Collects quantitative metrics from scenario runs including
 timing, token usage, costs, and verification results.
 """
 
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
+import sys
 
 from ..models.scenario import Scenario
 from ..models.result import Metrics, VerificationResult, ResultStatus
@@ -43,6 +45,7 @@ class MetricsCollector:
         start_time: datetime,
         end_time: datetime,
         retries: int = 0,
+        duration_seconds: Optional[float] = None,
     ) -> Metrics:
         """Collect metrics from a scenario run.
 
@@ -53,6 +56,8 @@ class MetricsCollector:
             start_time: When the run started
             end_time: When the run ended
             retries: Number of retry attempts made
+            duration_seconds: Elapsed time measured on a monotonic clock
+                (derived from start_time/end_time if not given)
 
         Returns:
             Metrics object with all collected data
@@ -61,7 +66,10 @@ class MetricsCollector:
         status = self._determine_status(agent_response, verification_result)
 
         # Calculate duration
-        duration = (end_time - start_time).total_seconds()
+        if duration_seconds is not None:
+            duration = duration_seconds
+        else:
+            duration = (end_time - start_time).total_seconds()
 
         return Metrics(
             scenario_id=scenario.id,
@@ -141,12 +149,20 @@ class MetricsCollector:
 class MetricsAggregator:
     """Aggregates metrics across multiple runs.
 
-    Useful for analyzing performance across a test suite.
+    Useful for analyzing performance across a test suite. Totals are
+    updated as metrics are added, so summary properties are O(1).
     """
 
     def __init__(self):
         """Initialize aggregator."""
         self.metrics_list: list = []
+        self._status_counts: Dict[ResultStatus, int] = defaultdict(int)
+        self._by_scenario: Dict[str, List[Metrics]] = defaultdict(list)
+        self._total_duration = 0.0
+        self._total_cost = 0.0
+        self._total_tokens_input = 0
+        self._total_tokens_output = 0
+        self._total_retries = 0
 
     def add(self, metrics: Metrics) -> None:
         """Add metrics from a run.
@@ -155,6 +171,14 @@ class MetricsAggregator:
             metrics: Metrics to add
         """
         self.metrics_list.append(metrics)
+        self._status_counts[metrics.status] += 1
+        # Interned so repeated runs of a scenario share one key object
+        self._by_scenario[sys.intern(metrics.scenario_id)].append(metrics)
+        self._total_duration += metrics.duration_seconds
+        self._total_cost += metrics.agent_cost_usd or 0
+        self._total_tokens_input += metrics.agent_tokens_input or 0
+        self._total_tokens_output += metrics.agent_tokens_output or 0
+        self._total_retries += metrics.retries
 
     @property
     def total_runs(self) -> int:
@@ -164,22 +188,22 @@ class MetricsAggregator:
     @property
     def passed_runs(self) -> int:
         """Number of passed runs."""
-        return sum(1 for m in self.metrics_list if m.status == ResultStatus.PASSED)
+        return self._status_counts[ResultStatus.PASSED]
 
     @property
     def failed_runs(self) -> int:
         """Number of failed runs."""
-        return sum(1 for m in self.metrics_list if m.status == ResultStatus.FAILED)
+        return self._status_counts[ResultStatus.FAILED]
 
     @property
     def error_runs(self) -> int:
         """Number of error runs."""
-        return sum(1 for m in self.metrics_list if m.status == ResultStatus.ERROR)
+        return self._status_counts[ResultStatus.ERROR]
 
     @property
     def timeout_runs(self) -> int:
         """Number of timeout runs."""
-        return sum(1 for m in self.metrics_list if m.status == ResultStatus.TIMEOUT)
+        return self._status_counts[ResultStatus.TIMEOUT]
 
     @property
     def pass_rate(self) -> float:
@@ -191,7 +215,7 @@ class MetricsAggregator:
     @property
     def total_duration(self) -> float:
         """Total duration in seconds."""
-        return sum(m.duration_seconds for m in self.metrics_list)
+        return self._total_duration
 
     @property
     def avg_duration(self) -> float:
@@ -203,22 +227,22 @@ class MetricsAggregator:
     @property
     def total_cost(self) -> float:
         """Total cost in USD."""
-        return sum(m.agent_cost_usd or 0 for m in self.metrics_list)
+        return self._total_cost
 
     @property
     def total_tokens_input(self) -> int:
         """Total input tokens."""
-        return sum(m.agent_tokens_input or 0 for m in self.metrics_list)
+        return self._total_tokens_input
 
     @property
     def total_tokens_output(self) -> int:
         """Total output tokens."""
-        return sum(m.agent_tokens_output or 0 for m in self.metrics_list)
+        return self._total_tokens_output
 
     @property
     def total_retries(self) -> int:
         """Total retry attempts."""
-        return sum(m.retries for m in self.metrics_list)
+        return self._total_retries
 
     def summary(self) -> dict:
         """Get summary statistics.
@@ -247,12 +271,10 @@ class MetricsAggregator:
         Returns:
             Dict mapping scenario_id to list of metrics
         """
-        result = {}
-        for m in self.metrics_list:
-            if m.scenario_id not in result:
-                result[m.scenario_id] = []
-            result[m.scenario_id].append(m)
-        return result
+        return {
+            scenario_id: list(metrics)
+            for scenario_id, metrics in self._by_scenario.items()
+        }
 
     def scenario_summary(self, scenario_id: str) -> Optional[dict]:
         """Get summary for a specific scenario.
@@ -263,7 +285,7 @@ class MetricsAggregator:
         Returns:
             Summary dict or None if no runs for scenario
         """
-        scenario_metrics = [m for m in self.metrics_list if m.scenario_id == scenario_id]
+        scenario_metrics = self._by_scenario.get(scenario_id)
         if not scenario_metrics:
             return None
 
@@ -5,10 +5,16 @@ The Verifier runs command and file checks to determine if
 an agent's work meets the success criteria defined in a scenario.
 """
 
-import subprocess
+import codecs
+import locale
+import mmap
+import os
 import re
+import shlex
+import subprocess
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import logging
@@ -20,6 +26,110 @@ from ..exceptions import VerificationError
 logger = logging.getLogger(__name__)
 
 
+# Files above this size are scanned via mmap for contains/not_contains
+# instead of being read into memory.
+_MMAP_SCAN_MIN_BYTES = 1 << 20
+
+
+class _MappedFile:
+    """Large file supporting ``text in mapped_file`` without reading it.
+
+    Each test maps the file read-only and searches the raw bytes, so no
+    newline translation happens (see _can_scan_mapped).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __contains__(self, text: str) -> bool:
+        needle = text.encode(locale.getpreferredencoding(False))
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+
+
+class _FileContent:
+    """File read once as bytes, decoded to text only when a check needs it."""
+
+    __slots__ = ("data", "_text")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Content as open(path).read() would return it."""
+        if self._text is None:
+            text = self.data.decode(locale.getpreferredencoding(False))
+            if "\r" in text:  # Universal newlines, as text mode applies
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            self._text = text
+        return self._text
+
+    def __contains__(self, text: str) -> bool:
+        return text.encode("utf-8") in self.data
+
+
+def _bytes_searchable(spec: FileCheck) -> bool:
+    """Whether a file check can search raw bytes instead of decoded text.
+
+    Only plain substring checks under a UTF-8 locale qualify (a UTF-8
+    needle can't match mid-character). Regex checks need text, and needles
+    with line breaks depend on newline translation.
+    """
+    if spec.matches_regex:
+        return False
+    if codecs.lookup(locale.getpreferredencoding(False)).name != "utf-8":
+        return False
+    for needle in (spec.contains, spec.not_contains):
+        if needle and ("\n" in needle or "\r" in needle):
+            return False
+    return True
+
+
+def _can_scan_mapped(spec: FileCheck, file_path: str) -> bool:
+    """Whether a file check can run against an mmap instead of a full read."""
+    return _bytes_searchable(spec) and os.path.getsize(file_path) > _MMAP_SCAN_MIN_BYTES
+
+
+# Literal `echo`/`exit` commands whose output is fully determined without a
+# shell: no expansions, globs, redirections, escapes or command separators.
+_ECHO_RE = re.compile(r"echo(?: +([^$`\\*?\[\]<>|&;#~(){}^\n]*))?")
+_EXIT_RE = re.compile(r"exit(?: +(\d+))?")
+
+
+def _run_builtin(cmd: str) -> Optional[subprocess.CompletedProcess]:
+    """Evaluate a trivial `echo`/`exit` command without spawning a shell.
+
+    Args:
+        cmd: Command string from a CommandCheck
+
+    Returns:
+        CompletedProcess as /bin/sh would produce it, or None if the command
+        is anything other than a plain literal echo/exit
+    """
+    cmd = cmd.strip()
+
+    match = _EXIT_RE.fullmatch(cmd)
+    if match:
+        code = int(match.group(1)) & 0xFF if match.group(1) else 0
+        return subprocess.CompletedProcess(cmd, code, stdout="", stderr="")
+
+    match = _ECHO_RE.fullmatch(cmd)
+    if match:
+        try:
+            args = shlex.split(match.group(1) or "")
+        except ValueError:  # Unbalanced quotes - let the shell report it
+            return None
+        # echo treats leading dashes as options (-n, -e) depending on the shell
+        if any(arg.startswith("-") for arg in args):
+            return None
+        return subprocess.CompletedProcess(cmd, 0, stdout=" ".join(args) + "\n", stderr="")
+
+    return None
+
+
 class Verifier:
     """Deterministic verification of agent output.
 
@@ -41,6 +151,15 @@ class Verifier:
                 print(f"Failed: {failure}")
     """
 
+    def __init__(self, shortcut_builtins: bool = True):
+        """Initialize verifier.
+
+        Args:
+            shortcut_builtins: Evaluate trivial literal `echo`/`exit` checks
+                in-process instead of spawning a shell
+        """
+        self.shortcut_builtins = shortcut_builtins
+
     def verify(
         self,
         spec: VerificationSpec,
@@ -60,28 +179,23 @@ class Verifier:
         custom_result: Optional[Dict[str, Any]] = None
         overall_error: Optional[str] = None
 
-        # Run command checks
-        for cmd_spec in spec.commands:
-            try:
-                result = self._check_command(cmd_spec, workdir)
-                command_results.append(result)
-            except Exception as e:
-                logger.error(f"Command check failed unexpectedly: {cmd_spec.cmd}: {e}")
-                command_results.append(CommandResult(
-                    cmd=cmd_spec.cmd,
-                    exit_code=-1,
-                    expected_exit_code=cmd_spec.expect_exit_code,
-                    stdout="",
-                    stderr=str(e),
-                    passed=False,
-                    duration_seconds=0.0,
-                    error=str(e),
+        # Run command checks (independent subprocesses, so run them concurrently)
+        workers = min(len(spec.commands), os.cpu_count() or 1)
+        if spec.parallel and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                command_results.extend(executor.map(
+                    lambda cmd_spec: self._safe_check_command(cmd_spec, workdir),
+                    spec.commands,
                 ))
+        else:
+            for cmd_spec in spec.commands:
+                command_results.append(self._safe_check_command(cmd_spec, workdir))
 
-        # Run file checks
+        # Run file checks (several checks on one path share a single read)
+        file_contents: Dict[str, _FileContent] = {}
         for file_spec in spec.files:
             try:
-                result = self._check_file(file_spec, workdir)
+                result = self._check_file(file_spec, workdir, file_contents)
                 file_results.append(result)
             except Exception as e:
                 logger.error(f"File check failed unexpectedly: {file_spec.path}: {e}")
@@ -117,6 +231,35 @@ class Verifier:
             error=overall_error,
         )
 
+    def _safe_check_command(
+        self,
+        spec: CommandCheck,
+        workdir: Path,
+    ) -> CommandResult:
+        """Run a command check, converting unexpected errors into a failed result.
+
+        Args:
+            spec: Command check specification
+            workdir: Working directory
+
+        Returns:
+            CommandResult with check outcome
+        """
+        try:
+            return self._check_command(spec, workdir)
+        except Exception as e:
+            logger.error(f"Command check failed unexpectedly: {spec.cmd}: {e}")
+            return CommandResult(
+                cmd=spec.cmd,
+                exit_code=-1,
+                expected_exit_code=spec.expect_exit_code,
+                stdout="",
+                stderr=str(e),
+                passed=False,
+                duration_seconds=0.0,
+                error=str(e),
+            )
+
     def _check_command(
         self,
         spec: CommandCheck,
@@ -133,15 +276,20 @@ class Verifier:
         """
         start_time = time.time()
 
+        # Plain subprocess.run on purpose: since Python 3.10 the default
+        # Linux path already spawns via vfork, and forcing the posix_spawn
+        # path (no cwd=, close_fds=False) measured slower, not faster.
         try:
-            result = subprocess.run(
-                spec.cmd,
-                cwd=workdir,
-                capture_output=True,
-                text=True,
-                timeout=spec.timeout_seconds,
-                shell=True,
-            )
+            result = _run_builtin(spec.cmd) if self.shortcut_builtins else None
+            if result is None:
+                result = subprocess.run(
+                    spec.cmd,
+                    cwd=workdir,
+                    capture_output=True,
+                    text=True,
+                    timeout=spec.timeout_seconds,
+                    shell=True,
+                )
         except subprocess.TimeoutExpired:
             duration = time.time() - start_time
             return CommandResult(
@@ -209,18 +357,21 @@ class Verifier:
         self,
         spec: FileCheck,
         workdir: Path,
+        content_cache: Optional[Dict[str, "_FileContent"]] = None,
     ) -> FileResult:
         """Check file existence and contents.
 
         Args:
             spec: File check specification
             workdir: Working directory
+            content_cache: Optional dict of already-read file contents,
+                filled in as files are read
 
         Returns:
             FileResult with check outcome
         """
-        file_path = workdir / spec.path
-        exists = file_path.exists()
+        file_path = os.path.join(workdir, spec.path)
+        exists = os.path.exists(file_path)
 
         # If file should not exist
         if not spec.exists:
@@ -244,7 +395,17 @@ class Verifier:
 
         # File exists, check contents
         try:
-            content = file_path.read_text()
+            if _can_scan_mapped(spec, file_path):
+                content = _MappedFile(file_path)
+            else:
+                cached = content_cache.get(file_path) if content_cache is not None else None
+                if cached is None:
+                    with open(file_path, "rb") as f:
+                        cached = _FileContent(f.read())
+                    if content_cache is not None:
+                        content_cache[file_path] = cached
+                # Substring checks search the raw bytes and skip decoding
+                content = cached if _bytes_searchable(spec) else cached.text
         except Exception as e:
             return FileResult(
                 path=spec.path,
@@ -277,7 +438,7 @@ class Verifier:
 
         # Regex match check
         if spec.matches_regex:
-            if not re.search(spec.matches_regex, content):
+            if not spec.regex_matches(content):
                 passed = False
                 failure_reasons.append(
                     f"does not match regex: {spec.matches_regex}"
@@ -9,6 +9,12 @@ import json
 from typing import Optional, List
 import logging
 
+# orjson (optional) decodes straight from UTF-8 bytes in C
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.scenario import Scenario
 from ..models.result import VerificationResult, WatchdogResult
 from ..config import WatchdogConfig
@@ -17,6 +23,17 @@ from ..exceptions import WatchdogError
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(text: str):
+    """Parse JSON text, using orjson when it's installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    handle a single exception type either way.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class Watchdog:
     """LLM-based evaluation of agent output.
 
@@ -216,12 +233,13 @@ Focus on patterns that can be learned from."""
         try:
             # Try to extract JSON from response
             # Handle case where response might have text before/after JSON
+            # (plain find/rfind scans beat a greedy DOTALL regex here)
             start = response.find("{")
             end = response.rfind("}") + 1
 
             if start >= 0 and end > start:
                 json_str = response[start:end]
-                data = json.loads(json_str)
+                data = _json_loads(json_str)
 
                 return WatchdogResult(
                     understanding=data.get("understanding", "unknown"),
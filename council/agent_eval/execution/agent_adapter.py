@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from enum import Enum
 
+from .._compat import DATACLASS_SLOTS
+
 
 class AgentType(Enum):
     """Supported agent types."""
@@ -21,7 +23,7 @@ class AgentType(Enum):
     MOCK = "mock"  # For testing
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentResponse:
     """Response from an agent execution.
 
@@ -112,6 +114,19 @@ class AgentAdapter(ABC):
         """Return the type of agent this adapter supports."""
         return AgentType.CUSTOM
 
+    def prewarm(self) -> None:
+        """Pay one-time startup costs before the first execution.
+
+        Called by the runner concurrently with environment setup, so any
+        cold-start work done here overlaps with workdir creation. Must be
+        safe to call more than once.
+
+        Override to do things like:
+        - Resolve the CLI executable
+        - Open API clients/connections
+        """
+        pass
+
     def validate_environment(self) -> bool:
         """Check if the agent's prerequisites are met.
 
@@ -202,3 +217,7 @@ class MockAdapter(AgentAdapter):
     def last_call(self) -> Optional[Dict[str, Any]]:
         """Get the last call arguments."""
         return self.calls[-1] if self.calls else None
+
+    def reset(self) -> None:
+        """Forget recorded calls so the adapter can be reused."""
+        self.calls.clear()
@@ -4,9 +4,11 @@ Claude Code CLI adapter for Agent Eval.
 Executes prompts using the Claude Code CLI tool.
 """
 
+import os
 import subprocess
 import time
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 import logging
@@ -18,6 +20,15 @@ from ..exceptions import ExecutionError, TimeoutError
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _resolve_claude(search_path: Optional[str]) -> Optional[str]:
+    """Look up the claude executable on a PATH string.
+
+    Cached per PATH value so every adapter in the process shares one scan.
+    """
+    return shutil.which("claude", path=search_path)
+
+
 class ClaudeAdapter(AgentAdapter):
     """Adapter for Claude Code CLI.
 
@@ -81,6 +92,8 @@ class ClaudeAdapter(AgentAdapter):
 
             logger.debug(f"Executing Claude in {workdir}: {prompt[:100]}...")
 
+            # No preexec_fn here: it would force fork() of this whole
+            # interpreter instead of CPython's vfork spawn path
             result = subprocess.run(
                 cmd,
                 cwd=workdir,
@@ -136,7 +149,7 @@ class ClaudeAdapter(AgentAdapter):
             ExecutionError: If Claude CLI not found
         """
         if self._claude_path is None:
-            self._claude_path = shutil.which("claude")
+            self._claude_path = _resolve_claude(os.environ.get("PATH"))
             if not self._claude_path:
                 raise ExecutionError(
                     "Claude CLI not found in PATH. "
@@ -144,6 +157,19 @@ class ClaudeAdapter(AgentAdapter):
                 )
         return self._claude_path
 
+    @classmethod
+    def invalidate_path_cache(cls) -> None:
+        """Forget cached CLI lookups (e.g. after installing claude)."""
+        _resolve_claude.cache_clear()
+
+    def prewarm(self) -> None:
+        """Resolve the Claude CLI path ahead of the first execution.
+
+        Raises:
+            ExecutionError: If Claude CLI not found
+        """
+        self._get_claude_path()
+
     @property
     def agent_type(self) -> AgentType:
         return AgentType.CLAUDE
@@ -6,6 +6,7 @@ where scenarios run. This provides isolation between tests and
 clean starting states.
 """
 
+import os
 import shutil
 import subprocess
 import tempfile
@@ -19,6 +20,49 @@ from ..config import ExecutionConfig
 
 logger = logging.getLogger(__name__)
 
+_GIT_USER_EMAIL = "agent-eval@test.local"
+_GIT_USER_NAME = "Agent Eval"
+_GIT_USER_CONFIG = f"[user]\n\temail = {_GIT_USER_EMAIL}\n\tname = {_GIT_USER_NAME}\n"
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes with raw fd calls, skipping the buffered file object."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _scandir_rmtree(path: str) -> None:
+    """Remove a directory tree using the stat data cached on DirEntry."""
+    unlink, rmdir = os.unlink, os.rmdir
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                unlink(entry.path)
+    rmdir(path)
+
+
+def _remove_tree(path: Path) -> None:
+    """Remove a working directory, falling back to shutil.rmtree on errors.
+
+    The scandir loop skips shutil's per-entry lstat/islink checks, which
+    adds up for workdirs with installed dependencies. Anything unusual
+    (permissions, deep nesting) is left to shutil.rmtree to finish and
+    report.
+    """
+    try:
+        _scandir_rmtree(os.fspath(path))
+    except (OSError, RecursionError):
+        shutil.rmtree(path)
+
 
 class Environment:
     """Isolated execution environment for a scenario.
@@ -51,6 +95,7 @@ class Environment:
         scenario: Scenario,
         config: ExecutionConfig,
         workdir: Optional[Path] = None,
+        template: Optional[Path] = None,
     ):
         """Initialize environment.
 
@@ -58,10 +103,13 @@ class Environment:
             scenario: The scenario to set up
             config: Execution configuration
             workdir: Optional explicit working directory (creates temp dir if None)
+            template: Optional fully set-up directory to copy instead of
+                running the scenario's setup steps
         """
         self.scenario = scenario
         self.config = config
         self._workdir = workdir
+        self._template = template
         self._created = False  # Whether we created the directory
         self._setup_complete = False
 
@@ -97,6 +145,15 @@ class Environment:
 
             logger.info(f"Setting up environment in {self._workdir}")
 
+            # Clone a prepared template instead of repeating setup
+            if self._template is not None:
+                shutil.copytree(
+                    self._template, self._workdir, symlinks=True, dirs_exist_ok=True
+                )
+                self._setup_complete = True
+                logger.info(f"Environment cloned from template: {self._template}")
+                return self._workdir
+
             # Create files
             self._create_files()
 
@@ -131,14 +188,18 @@ class Environment:
 
     def _create_files(self) -> None:
         """Create files specified in the setup."""
-        for file_spec in self.scenario.setup.files:
-            file_path = self._workdir / file_spec.path
+        files = self.scenario.setup.files
+
+        # Create each unique parent directory once
+        parents = {(self._workdir / f.path).parent for f in files}
+        parents.discard(self._workdir)
+        for parent in sorted(parents):
+            parent.mkdir(parents=True, exist_ok=True)
 
-            # Create parent directories
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        for file_spec in files:
+            file_path = self._workdir / file_spec.path
 
-            # Write content
-            file_path.write_text(file_spec.content, encoding=file_spec.encoding)
+            _write_file(file_path, file_spec.content.encode(file_spec.encoding))
             logger.debug(f"Created file: {file_path}")
 
     def _init_git(self) -> None:
@@ -148,14 +209,18 @@ class Environment:
         # git init
         self._run_setup_command(["git", "init"])
 
-        # Configure git user (required for commits)
-        self._run_setup_command(
-            ["git", "config", "user.email", "agent-eval@test.local"]
-        )
-        self._run_setup_command(["git", "config", "user.name", "Agent Eval"])
+        # Configure git user (required for commits). Appending to the repo
+        # config in-process saves two `git config` fork/execs per setup.
+        git_config = self._workdir / ".git" / "config"
+        if git_config.exists():
+            with open(git_config, "a", encoding="utf-8") as f:
+                f.write(_GIT_USER_CONFIG)
+        else:
+            self._run_setup_command(["git", "config", "user.email", _GIT_USER_EMAIL])
+            self._run_setup_command(["git", "config", "user.name", _GIT_USER_NAME])
 
         # Initial commit if there are files
-        if list(self._workdir.iterdir()):
+        if any(p.name != ".git" for p in self._workdir.iterdir()):
             self._run_setup_command(["git", "add", "."])
             self._run_setup_command(["git", "commit", "-m", "Initial commit"])
 
@@ -252,7 +317,7 @@ class Environment:
         # Remove directory if we created it
         if self._created:
             try:
-                shutil.rmtree(self._workdir)
+                _remove_tree(self._workdir)
                 logger.debug(f"Cleaned up environment: {self._workdir}")
             except Exception as e:
                 logger.error(f"Failed to cleanup environment: {e}")
@@ -5,7 +5,6 @@ Provides utilities for retrying operations that may fail transiently,
 with configurable retry counts and backoff strategies.
 """
 
-import asyncio
 import time
 import functools
 from typing import Callable, TypeVar, Optional, Tuple, Type, Union
@@ -122,6 +121,8 @@ class RetryManager:
                 "API call"
             )
         """
+        import asyncio  # Deferred so sync-only users don't load asyncio
+
         last_error: Optional[Exception] = None
         attempts = self.max_retries + 1
 
@@ -5,7 +5,6 @@ Provides utilities for enforcing timeouts on operations,
 both synchronous (via signals) and asynchronous (via asyncio).
 """
 
-import asyncio
 import signal
 import functools
 from contextlib import contextmanager
@@ -38,9 +37,12 @@ class TimeoutManager:
 
     @staticmethod
     @contextmanager
-    def timeout(seconds: int, message: str = "Operation timed out"):
+    def timeout(seconds: float, message: str = "Operation timed out"):
         """Context manager for synchronous timeout using signals.
 
+        Uses an ITIMER_REAL interval timer, so fractional timeouts are
+        honored (``signal.alarm`` only takes whole seconds).
+
         Note: Only works on Unix-like systems and in the main thread.
         For cross-platform or thread-safe timeouts, use subprocess
         with timeout parameter.
@@ -64,23 +66,27 @@ class TimeoutManager:
 
         # Store the old handler
         old_handler = signal.signal(signal.SIGALRM, handler)
-        signal.alarm(seconds)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
 
         try:
             yield
         finally:
-            # Cancel alarm and restore handler
-            signal.alarm(0)
+            # Cancel timer and restore handler
+            signal.setitimer(signal.ITIMER_REAL, 0)
             signal.signal(signal.SIGALRM, old_handler)
 
     @staticmethod
     async def with_timeout(
         coro,
-        seconds: int,
+        seconds: float,
         message: str = "Operation timed out",
     ) -> Any:
         """Execute a coroutine with timeout.
 
+        On Python 3.11+ the coroutine is awaited in the current task under
+        ``asyncio.timeout``; older versions fall back to ``asyncio.wait_for``,
+        which wraps it in a new task.
+
         Args:
             coro: Coroutine to execute
             seconds: Timeout in seconds
@@ -99,7 +105,14 @@ class TimeoutManager:
                 "API request timed out"
             )
         """
+        # Imported here so sync-only users don't load asyncio at import time
+        import asyncio
+
         try:
+            # asyncio.timeout() (3.11+) avoids the extra task wait_for creates
+            if hasattr(asyncio, "timeout"):
+                async with asyncio.timeout(seconds):
+                    return await coro
             return await asyncio.wait_for(coro, timeout=seconds)
         except asyncio.TimeoutError:
             raise TimeoutError(message)
@@ -11,7 +11,9 @@ These capture the outcomes of scenario runs, including:
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
+
+from .._compat import DATACLASS_SLOTS
 
 
 class ResultStatus(Enum):
@@ -24,7 +26,7 @@ class ResultStatus(Enum):
     SKIPPED = "skipped"  # Scenario was skipped (e.g., filtered out)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandResult:
     """Result of a command verification check.
 
@@ -45,7 +47,7 @@ class CommandResult:
         return f"[{status}] {self.cmd} (exit={self.exit_code}, expected={self.expected_exit_code})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileResult:
     """Result of a file verification check.
 
@@ -65,7 +67,7 @@ class FileResult:
         return f"[{status}] {self.path} (exists={self.exists})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VerificationResult:
     """Combined result of all verification checks.
 
@@ -104,22 +106,28 @@ class VerificationResult:
 
     def failures(self) -> List[str]:
         """Get list of failure messages."""
-        failures = []
+        return list(self.iter_failures())
+
+    def iter_failures(self) -> Iterator[str]:
+        """Lazily yield failure messages.
+
+        Messages are only formatted for failed checks, and only as the
+        caller consumes them (e.g. ``next(result.iter_failures(), None)``).
+        """
         for r in self.command_results:
             if not r.passed:
-                failures.append(f"Command failed: {r.cmd} (exit={r.exit_code})")
+                yield f"Command failed: {r.cmd} (exit={r.exit_code})"
         for r in self.file_results:
             if not r.passed:
                 if not r.exists and r.expected_exists:
-                    failures.append(f"File missing: {r.path}")
+                    yield f"File missing: {r.path}"
                 elif r.contains_check and not r.contains_found:
-                    failures.append(f"File {r.path} missing content: {r.contains_check[:50]}...")
+                    yield f"File {r.path} missing content: {r.contains_check[:50]}..."
                 else:
-                    failures.append(f"File check failed: {r.path}")
-        return failures
+                    yield f"File check failed: {r.path}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WatchdogResult:
     """Result of LLM watchdog evaluation.
 
@@ -157,7 +165,7 @@ class WatchdogResult:
         return f"Understanding: {self.understanding}, Approach: {self.approach}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Metrics:
     """Quantitative metrics for a scenario run.
 
@@ -10,11 +10,16 @@ A Scenario defines:
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Pattern
+import copy
+import os
+import re
 
 import yaml
 
+from .._compat import DATACLASS_SLOTS, YamlSafeDumper, YamlSafeLoader
 from ..exceptions import ScenarioError
 
 
@@ -31,7 +36,7 @@ class Difficulty(Enum):
     EXPERT = "expert"  # Requires deep understanding
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileSpec:
     """Specification for a file to create in the test environment.
 
@@ -54,7 +59,7 @@ class FileSpec:
             )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SetupSpec:
     """Specification for environment setup.
 
@@ -68,7 +73,7 @@ class SetupSpec:
     pip_install: List[str] = field(default_factory=list)  # Packages to pip install
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandCheck:
     """Specification for a command-based verification check.
 
@@ -89,7 +94,7 @@ class CommandCheck:
             raise ScenarioError("CommandCheck timeout_seconds must be positive")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileCheck:
     """Specification for a file-based verification check.
 
@@ -105,9 +110,35 @@ class FileCheck:
     def __post_init__(self):
         if not self.path:
             raise ScenarioError("FileCheck path cannot be empty")
+        if self.matches_regex:
+            try:
+                _compile_regex(self.matches_regex)
+            except re.error as e:
+                raise ScenarioError(
+                    f"FileCheck matches_regex is invalid: {self.matches_regex}: {e}"
+                )
+
+    @property
+    def compiled_regex(self) -> Optional[Pattern]:
+        """Compiled form of matches_regex (None if not set)."""
+        if not self.matches_regex:
+            return None
+        return _compile_regex(self.matches_regex)
+
+    def regex_matches(self, content: str) -> bool:
+        """Check content against matches_regex.
+
+        Patterns without regex metacharacters are checked with a plain
+        substring test, skipping the regex engine entirely.
+        """
+        if not self.matches_regex:
+            return True
+        if _is_literal_pattern(self.matches_regex):
+            return self.matches_regex in content
+        return self.compiled_regex.search(content) is not None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VerificationSpec:
     """Specification for all verification checks.
 
@@ -117,6 +148,7 @@ class VerificationSpec:
     commands: List[CommandCheck] = field(default_factory=list)
     files: List[FileCheck] = field(default_factory=list)
     custom_verifier: Optional[str] = None  # Path to custom verification script
+    parallel: bool = True  # Run command checks concurrently
 
     @property
     def total_checks(self) -> int:
@@ -124,7 +156,7 @@ class VerificationSpec:
         return len(self.commands) + len(self.files) + (1 if self.custom_verifier else 0)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Scenario:
     """A complete test scenario.
 
@@ -205,19 +237,18 @@ class Scenario:
         Raises:
             ScenarioError: If file not found, invalid YAML, or validation fails
         """
-        if not path.exists():
-            raise ScenarioError(f"Scenario file not found: {path}")
-
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ScenarioError(f"Invalid YAML in {path}: {e}")
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise ScenarioError(f"Scenario file not found: {path}")
 
+        # Parsed data is cached per file version; copy it so the new
+        # scenario never shares mutable lists/dicts with the cache
+        data = _load_yaml_data(str(path), stat.st_mtime_ns, stat.st_size)
         if not data:
             raise ScenarioError(f"Empty scenario file: {path}")
 
-        return cls.from_dict(data, source_path=path)
+        return cls.from_dict(copy.deepcopy(data), source_path=path)
 
     @classmethod
     def from_dict(
@@ -268,6 +299,7 @@ class Scenario:
                     FileCheck(**f) for f in verif_data.get("files", [])
                 ],
                 custom_verifier=verif_data.get("custom_verifier"),
+                parallel=verif_data.get("parallel", True),
             )
 
             return cls(
@@ -333,6 +365,7 @@ class Scenario:
                         for f in self.verification.files
                     ],
                     "custom_verifier": self.verification.custom_verifier,
+                    "parallel": self.verification.parallel,
                 },
                 "teardown_commands": self.teardown_commands,
                 "difficulty": self.difficulty.value,
@@ -347,7 +380,41 @@ class Scenario:
 
     def to_yaml(self) -> str:
         """Serialize scenario to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            self.to_dict(), Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False
+        )
+
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_data(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a scenario YAML file.
+
+    Cached on the file's mtime and size so an edited file is re-read.
+    """
+    try:
+        with open(path) as f:
+            return yaml.load(f, Loader=YamlSafeLoader)
+    except yaml.YAMLError as e:
+        raise ScenarioError(f"Invalid YAML in {path}: {e}")
+
+
+@lru_cache(maxsize=1024)
+def _is_literal_pattern(pattern: str) -> bool:
+    """Whether a regex pattern contains no metacharacters (matches itself literally)."""
+    return not _REGEX_METACHARS.intersection(pattern)
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> Pattern:
+    """Compile a verification regex, shared across checks using the same pattern.
+
+    Keeps compiled patterns out of the small re module cache so large scenario
+    batches don't evict each other.
+    """
+    return re.compile(pattern)
 
 
 def _normalize_command_check(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -10,9 +10,11 @@ The AgentEvalRunner orchestrates the entire evaluation process:
 6. Return results
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
+import time
 import uuid
 import logging
 
@@ -92,6 +94,7 @@ class AgentEvalRunner:
         """
         run_id = str(uuid.uuid4())[:8]
         start_time = datetime.now()
+        start_clock = time.monotonic()
 
         logger.info(f"[{run_id}] Running scenario: {scenario.id} - {scenario.name}")
 
@@ -100,8 +103,15 @@ class AgentEvalRunner:
         verification_result: Optional[VerificationResult] = None
 
         try:
-            # Setup environment
-            workdir = env.setup()
+            # Setup environment while the agent warms up. Adapters that keep
+            # the no-op default (e.g. MockAdapter) skip the helper thread.
+            if type(self.agent).prewarm is AgentAdapter.prewarm:
+                workdir = env.setup()
+            else:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    warmup = executor.submit(self.agent.prewarm)
+                    workdir = env.setup()
+                    warmup.result()
             logger.debug(f"[{run_id}] Environment setup complete: {workdir}")
 
             # Determine timeout
@@ -132,6 +142,7 @@ class AgentEvalRunner:
                 verification_result=verification_result,
                 start_time=start_time,
                 end_time=end_time,
+                duration_seconds=time.monotonic() - start_clock,
             )
 
             # Run watchdog evaluation
@@ -168,19 +179,19 @@ class AgentEvalRunner:
         except TimeoutError as e:
             logger.error(f"[{run_id}] Timeout: {e}")
             return self._error_result(
-                scenario, run_id, start_time, ResultStatus.TIMEOUT, str(e)
+                scenario, run_id, start_time, ResultStatus.TIMEOUT, str(e), start_clock
             )
 
         except AgentEvalError as e:
             logger.error(f"[{run_id}] Error: {e}")
             return self._error_result(
-                scenario, run_id, start_time, ResultStatus.ERROR, str(e)
+                scenario, run_id, start_time, ResultStatus.ERROR, str(e), start_clock
             )
 
         except Exception as e:
             logger.exception(f"[{run_id}] Unexpected error: {e}")
             return self._error_result(
-                scenario, run_id, start_time, ResultStatus.ERROR, str(e)
+                scenario, run_id, start_time, ResultStatus.ERROR, str(e), start_clock
             )
 
         finally:
@@ -211,6 +222,7 @@ class AgentEvalRunner:
         """
         results = []
         total = len(scenarios)
+        passed = 0
 
         for i, scenario in enumerate(scenarios, 1):
             logger.info(f"Running scenario {i}/{total}: {scenario.name}")
@@ -218,7 +230,8 @@ class AgentEvalRunner:
             results.append(result)
 
             # Log progress
-            passed = sum(1 for r in results if r.passed)
+            if result.passed:
+                passed += 1
             logger.info(f"Progress: {passed}/{i} passed ({len(results)}/{total} complete)")
 
         return results
@@ -230,6 +243,7 @@ class AgentEvalRunner:
         start_time: datetime,
         status: ResultStatus,
         error: str,
+        start_clock: Optional[float] = None,
     ) -> RunResult:
         """Create an error result.
 
@@ -239,11 +253,16 @@ class AgentEvalRunner:
             start_time: When the run started
             status: Error status
             error: Error message
+            start_clock: time.monotonic() reading taken when the run started
 
         Returns:
             RunResult representing the error
         """
         end_time = datetime.now()
+        if start_clock is not None:
+            duration = time.monotonic() - start_clock
+        else:
+            duration = (end_time - start_time).total_seconds()
 
         return RunResult(
             scenario_id=scenario.id,
@@ -256,7 +275,7 @@ class AgentEvalRunner:
                 scenario_id=scenario.id,
                 start_time=start_time,
                 end_time=end_time,
-                duration_seconds=(end_time - start_time).total_seconds(),
+                duration_seconds=duration,
                 status=status,
                 verification_passed=False,
                 checks_passed=0,
@@ -7,12 +7,24 @@ from evaluation results.
 
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
 import json
 from statistics import mean
 
 from ..models.result import RunResult, ResultStatus
 
+# Markdown row template, parsed once at import instead of per row
+_ROW_TEMPLATE = "| {0} | {1} | {2} {3} | {4:.1f}s | {5} |\n"
+
+_STATUS_EMOJI = {
+    ResultStatus.PASSED: "✅",
+    ResultStatus.FAILED: "❌",
+    ResultStatus.ERROR: "💥",
+    ResultStatus.TIMEOUT: "⏱️",
+    ResultStatus.SKIPPED: "⏭️",
+}
+
 
 @dataclass
 class Report:
@@ -135,6 +147,20 @@ class Reporter:
         """
         return json.dumps(report.to_dict(), indent=indent, default=str)
 
+    def to_json_file(self, report: Report, path: Path, indent: int = 2) -> None:
+        """Write report as JSON directly to a file.
+
+        Serializes straight into the file handle instead of building
+        the full JSON string in memory first.
+
+        Args:
+            report: Report to export
+            path: Destination file path
+            indent: JSON indentation
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=indent, default=str)
+
     def to_markdown(self, report: Report) -> str:
         """Export report as Markdown.
 
@@ -144,7 +170,28 @@ class Reporter:
         Returns:
             Markdown string
         """
-        md = f"""# Agent Eval Report
+        return "".join(self._markdown_parts(report))
+
+    def to_markdown_file(self, report: Report, path: Path) -> None:
+        """Write report as Markdown directly to a file.
+
+        Args:
+            report: Report to export
+            path: Destination file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self._markdown_parts(report))
+
+    def _markdown_parts(self, report: Report) -> List[str]:
+        """Build the Markdown report as a list of text chunks.
+
+        Args:
+            report: Report to export
+
+        Returns:
+            List of strings that concatenate to the full report
+        """
+        parts = [f"""# Agent Eval Report
 
 **Generated:** {report.timestamp.strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -165,56 +212,52 @@ class Reporter:
 
 | ID | Name | Status | Duration | Checks |
 |----|------|--------|----------|--------|
-"""
+"""]
+        row = _ROW_TEMPLATE.format
         for r in report.results:
-            status_emoji = {
-                ResultStatus.PASSED: "✅",
-                ResultStatus.FAILED: "❌",
-                ResultStatus.ERROR: "💥",
-                ResultStatus.TIMEOUT: "⏱️",
-                ResultStatus.SKIPPED: "⏭️",
-            }.get(r.status, "❓")
-
-            md += (
-                f"| {r.scenario_id} | {r.scenario_name} | "
-                f"{status_emoji} {r.status.value} | "
-                f"{r.metrics.duration_seconds:.1f}s | "
-                f"{r.verification.summary()} |\n"
-            )
+            parts.append(row(
+                r.scenario_id,
+                r.scenario_name,
+                _STATUS_EMOJI.get(r.status, "❓"),
+                r.status.value,
+                r.metrics.duration_seconds,
+                r.verification.summary(),
+            ))
 
         # Add failure details for failed scenarios
         failures = [r for r in report.results if not r.passed]
         if failures:
-            md += """
+            parts.append("""
 ## Failure Details
 
-"""
+""")
             for r in failures:
-                md += f"### {r.scenario_id}: {r.scenario_name}\n\n"
+                parts.append(f"### {r.scenario_id}: {r.scenario_name}\n\n")
                 if r.error:
-                    md += f"**Error:** {r.error}\n\n"
-                if r.verification.failures():
-                    md += "**Failed checks:**\n"
-                    for failure in r.verification.failures():
-                        md += f"- {failure}\n"
-                    md += "\n"
+                    parts.append(f"**Error:** {r.error}\n\n")
+                failed_checks = r.verification.failures()
+                if failed_checks:
+                    parts.append("**Failed checks:**\n")
+                    for failure in failed_checks:
+                        parts.append(f"- {failure}\n")
+                    parts.append("\n")
                 if r.watchdog and r.watchdog.feedback_for_agent:
-                    md += f"**Watchdog feedback:** {r.watchdog.feedback_for_agent}\n\n"
+                    parts.append(f"**Watchdog feedback:** {r.watchdog.feedback_for_agent}\n\n")
 
         # Add identified patterns
         if report.patterns_identified:
-            md += """
+            parts.append("""
 ## Failure Patterns Identified
 
-"""
+""")
             for pattern in report.patterns_identified:
-                md += f"- {pattern}\n"
+                parts.append(f"- {pattern}\n")
 
-        md += """
+        parts.append("""
 ---
 *Generated by Agent Eval System*
-"""
-        return md
+""")
+        return parts
 
     def to_summary(self, report: Report) -> str:
         """Generate brief summary for console output.
@@ -304,34 +347,31 @@ class ComparisonReporter:
         trend = "📈" if comparison["improved"] else "📉"
         speed = "🚀" if comparison["faster"] else "🐌"
 
-        md = f"""# Agent Eval Comparison Report
+        parts = [f"""# Agent Eval Comparison Report
 
 ## Pass Rate
 {trend} **{comparison['current_pass_rate']:.1f}%** (was {comparison['baseline_pass_rate']:.1f}%, delta: {comparison['pass_rate_delta']:+.1f}%)
 
 ## Duration
 {speed} **{comparison['current_avg_duration']:.1f}s** avg (was {comparison['baseline_avg_duration']:.1f}s, delta: {comparison['duration_delta']:+.1f}s)
-"""
+"""]
 
         if comparison["regressions"]:
-            md += f"""
+            parts.append(f"""
 ## ⚠️ Regressions ({len(comparison['regressions'])})
-"""
-            for scenario_id in comparison["regressions"]:
-                md += f"- {scenario_id}\n"
+""")
+            parts.extend(f"- {scenario_id}\n" for scenario_id in comparison["regressions"])
 
         if comparison["improvements"]:
-            md += f"""
+            parts.append(f"""
 ## ✅ Improvements ({len(comparison['improvements'])})
-"""
-            for scenario_id in comparison["improvements"]:
-                md += f"- {scenario_id}\n"
+""")
+            parts.extend(f"- {scenario_id}\n" for scenario_id in comparison["improvements"])
 
         if comparison["new_patterns"]:
-            md += f"""
+            parts.append("""
 ## 🔍 New Patterns Identified
-"""
-            for pattern in comparison["new_patterns"]:
-                md += f"- {pattern}\n"
+""")
+            parts.extend(f"- {pattern}\n" for pattern in comparison["new_patterns"])
 
-        return md
+        return "".join(parts)
@@ -0,0 +1,93 @@
+"""Shared fixtures for Agent Eval tests."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pytest
+
+from council.agent_eval import ExecutionConfig, Scenario
+from council.agent_eval.execution import Environment, MockAdapter
+
+# Session-wide MockAdapters keyed by their constructor arguments
+_ADAPTER_POOL: Dict[Tuple[Tuple[str, Any], ...], MockAdapter] = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_tempdir(tmp_path_factory):
+    """Create scenario workdirs under this session's pytest basetemp.
+
+    Environment and tempfile.mkdtemp() callers land in a per-session (and,
+    under pytest-xdist, per-worker) directory instead of the shared system
+    temp root, and pytest prunes old basetemps, so workdirs kept after
+    failing scenarios don't pile up.
+    """
+    root = tmp_path_factory.mktemp("agent_eval")
+    previous = tempfile.tempdir
+    tempfile.tempdir = str(root)
+    yield root
+    tempfile.tempdir = previous
+
+
+@pytest.fixture(scope="session")
+def setup_template(worker_tempdir) -> Callable[[Scenario], Optional[Path]]:
+    """Return a lookup of set-up workdir templates, built once per session.
+
+    Pass the result as ``Environment(..., template=...)`` so repeated tests
+    copy a finished workdir (including ``.git``) instead of rewriting files
+    and re-running git. Templates live on /dev/shm when it is writable.
+    Setups with commands or package installs return None and run fresh,
+    since their side effects may not live in the working directory.
+    """
+    root = "/dev/shm" if os.access("/dev/shm", os.W_OK) else str(worker_tempdir)
+    config = ExecutionConfig()
+    templates: Dict[Hashable, Path] = {}
+
+    def get(scenario: Scenario) -> Optional[Path]:
+        setup = scenario.setup
+        if setup.commands or setup.npm_install or setup.pip_install:
+            return None
+        key = (
+            tuple((f.path, f.content, f.encoding) for f in setup.files),
+            setup.git_init,
+        )
+        template = templates.get(key)
+        if template is None:
+            template = Path(tempfile.mkdtemp(prefix="agent_eval_template_", dir=root))
+            Environment(scenario, config, workdir=template).setup()
+            templates[key] = template
+        return template
+
+    yield get
+    for template in templates.values():
+        shutil.rmtree(template, ignore_errors=True)
+
+
+@pytest.fixture
+def get_mock_adapter() -> Callable[..., MockAdapter]:
+    """Return a factory handing out pooled MockAdapters.
+
+    Adapters are shared across tests by configuration and reset after each
+    test, so call tracking starts from zero every time.
+    """
+    used = []
+
+    def get(**kwargs: Any) -> MockAdapter:
+        key = tuple(sorted(kwargs.items()))
+        adapter = _ADAPTER_POOL.get(key)
+        if adapter is None:
+            adapter = _ADAPTER_POOL[key] = MockAdapter(**kwargs)
+        used.append(adapter)
+        return adapter
+
+    yield get
+    for adapter in used:
+        adapter.reset()
+
+
+@pytest.fixture
+def mock_adapter(get_mock_adapter) -> MockAdapter:
+    """Default pooled MockAdapter."""
+    return get_mock_adapter()
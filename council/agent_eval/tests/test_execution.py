@@ -9,7 +9,8 @@ Tests:
 """
 
 import pytest
-import tempfile
+import subprocess
+import sys
 import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -33,7 +34,6 @@ from council.agent_eval.execution import (
     AgentAdapter,
     AgentResponse,
     AgentType,
-    MockAdapter,
     ClaudeAdapter,
 )
 from council.agent_eval.exceptions import (
@@ -42,6 +42,11 @@ from council.agent_eval.exceptions import (
     ExecutionError,
 )
 
+# Placeholder workdirs for adapters that never touch the filesystem
+_TMP = Path("/tmp")
+_TMP_A = _TMP / "a"
+_TMP_B = _TMP / "b"
+
 
 # ============================================================================
 # Environment Tests
@@ -94,11 +99,12 @@ class TestEnvironment:
         finally:
             env.cleanup()
 
-    def test_environment_as_context_manager(self, basic_scenario, exec_config):
+    def test_environment_as_context_manager(self, basic_scenario, exec_config, setup_template):
         """Test environment as context manager."""
         workdir_path = None
+        template = setup_template(basic_scenario)
 
-        with Environment(basic_scenario, exec_config) as env:
+        with Environment(basic_scenario, exec_config, template=template) as env:
             workdir_path = env.workdir
             assert workdir_path.exists()
             assert (workdir_path / "src/main.py").exists()
@@ -106,13 +112,30 @@ class TestEnvironment:
         # Should be cleaned up after exiting context
         assert not workdir_path.exists()
 
-    def test_environment_keeps_on_failure(self, basic_scenario, exec_config):
+    def test_environment_cleanup_does_not_follow_symlinks(
+        self, basic_scenario, exec_config, setup_template, tmp_path
+    ):
+        """Test cleanup removes symlinks without touching their targets."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        template = setup_template(basic_scenario)
+
+        with Environment(basic_scenario, exec_config, template=template) as env:
+            workdir_path = env.workdir
+            (workdir_path / "src" / "link").symlink_to(outside)
+
+        assert not workdir_path.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_environment_keeps_on_failure(self, basic_scenario, exec_config, setup_template):
         """Test environment keeps workdir on failure when configured."""
         exec_config.cleanup_on_failure = False
         workdir_path = None
+        template = setup_template(basic_scenario)
 
         try:
-            with Environment(basic_scenario, exec_config) as env:
+            with Environment(basic_scenario, exec_config, template=template) as env:
                 workdir_path = env.workdir
                 raise ValueError("Simulated failure")
         except ValueError:
@@ -155,12 +178,12 @@ class TestEnvironment:
             # Check we have an initial commit
             import subprocess
             result = subprocess.run(
-                ["git", "log", "--oneline"],
+                ["git", "log", "--format=%an <%ae>: %s"],
                 cwd=env.workdir,
                 capture_output=True,
                 text=True,
             )
-            assert "Initial commit" in result.stdout
+            assert "Agent Eval <agent-eval@test.local>: Initial commit" in result.stdout
 
     def test_environment_with_setup_commands(self, exec_config):
         """Test environment with custom setup commands."""
@@ -188,6 +211,45 @@ class TestEnvironment:
         assert env.config == exec_config
         assert env.scenario == basic_scenario
 
+    def test_environment_clones_template(self, exec_config, setup_template):
+        """Test templated environments are independent copies of one setup."""
+        scenario = Scenario(
+            id="test-template-001",
+            name="Template Test",
+            description="Test template cloning",
+            prompt="Do something",
+            verification=VerificationSpec(),
+            setup=SetupSpec(
+                files=[FileSpec(path="src/main.py", content="print('hello')")],
+                git_init=True,
+            ),
+        )
+        template = setup_template(scenario)
+        assert setup_template(scenario) == template
+
+        with Environment(scenario, exec_config, template=template) as first, \
+                Environment(scenario, exec_config, template=template) as second:
+            assert first.workdir != second.workdir
+            assert (second.workdir / ".git").exists()
+
+            (first.workdir / "src/main.py").write_text("changed")
+            assert (second.workdir / "src/main.py").read_text() == "print('hello')"
+
+        assert (template / "src/main.py").read_text() == "print('hello')"
+
+    def test_setup_template_skips_commands(self, setup_template):
+        """Test setups with commands are never templated."""
+        scenario = Scenario(
+            id="test-template-002",
+            name="Template Command Test",
+            description="Test commands run fresh",
+            prompt="Do something",
+            verification=VerificationSpec(),
+            setup=SetupSpec(commands=["echo setup > setup.txt"]),
+        )
+
+        assert setup_template(scenario) is None
+
 
 # ============================================================================
 # Timeout Manager Tests
@@ -197,6 +259,17 @@ class TestEnvironment:
 class TestTimeoutManager:
     """Test timeout management."""
 
+    def test_package_import_defers_asyncio(self):
+        """Importing the package alone should not load asyncio."""
+        code = "import sys, council.agent_eval; print('asyncio' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[3],  # repo root
+            capture_output=True,
+            text=True,
+        )
+        assert result.stdout.strip() == "False"
+
     def test_timeout_context_manager_allows_fast_operation(self):
         """Test that fast operations complete within timeout."""
         result = None
@@ -212,6 +285,31 @@ class TestTimeoutManager:
 
         assert "Test timeout" in str(exc_info.value)
 
+    def test_timeout_context_manager_fractional_seconds(self):
+        """Test that sub-second timeouts fire without rounding to whole seconds."""
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            with TimeoutManager.timeout(0.05, "Fractional timeout"):
+                time.sleep(5)
+
+        assert time.monotonic() - start < 1
+
+    def test_async_timeout_via_event_loop(self):
+        """Test async timeout without an async test plugin."""
+        import asyncio
+
+        async def fast():
+            return 42
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        result = asyncio.run(TimeoutManager.with_timeout(fast(), 5, "Should not timeout"))
+        assert result == 42
+
+        with pytest.raises(TimeoutError, match="Async timeout"):
+            asyncio.run(TimeoutManager.with_timeout(slow(), 0.05, "Async timeout"))
+
     @pytest.mark.skip(reason="Requires pytest-asyncio")
     async def test_async_timeout(self):
         """Test async timeout."""
@@ -388,59 +486,79 @@ class TestAgentResponse:
 class TestMockAdapter:
     """Test mock adapter for testing."""
 
-    def test_mock_adapter_returns_configured_response(self):
+    def test_mock_adapter_returns_configured_response(self, get_mock_adapter):
         """Test mock adapter returns configured values."""
-        adapter = MockAdapter(
+        adapter = get_mock_adapter(
             response_output="Test output",
             response_exit_code=0,
             response_duration=2.5,
         )
 
-        response = adapter.execute("do thing", Path("/tmp"), 60)
+        response = adapter.execute("do thing", _TMP, 60)
 
         assert response.output == "Test output"
         assert response.exit_code == 0
         assert response.duration_seconds == 2.5
 
-    def test_mock_adapter_tracks_calls(self):
+    def test_mock_adapter_tracks_calls(self, mock_adapter):
         """Test mock adapter tracks calls."""
-        adapter = MockAdapter()
+        mock_adapter.execute("prompt 1", _TMP_A, 30)
+        mock_adapter.execute("prompt 2", _TMP_B, 60)
+
+        assert mock_adapter.call_count == 2
+        assert mock_adapter.last_call["prompt"] == "prompt 2"
+        assert mock_adapter.last_call["timeout"] == 60
 
-        adapter.execute("prompt 1", Path("/tmp/a"), 30)
-        adapter.execute("prompt 2", Path("/tmp/b"), 60)
+    def test_mock_adapter_reset(self, mock_adapter):
+        """Test reset clears calls left by earlier use."""
+        assert mock_adapter.call_count == 0
 
-        assert adapter.call_count == 2
-        assert adapter.last_call["prompt"] == "prompt 2"
-        assert adapter.last_call["timeout"] == 60
+        mock_adapter.execute("prompt", _TMP, 30)
+        mock_adapter.reset()
 
-    def test_mock_adapter_simulates_timeout(self):
+        assert mock_adapter.call_count == 0
+        assert mock_adapter.last_call is None
+
+    def test_mock_adapter_simulates_timeout(self, get_mock_adapter):
         """Test mock adapter can simulate timeout."""
-        adapter = MockAdapter(should_timeout=True)
+        adapter = get_mock_adapter(should_timeout=True)
 
         with pytest.raises(TimeoutError):
-            adapter.execute("do thing", Path("/tmp"), 60)
+            adapter.execute("do thing", _TMP, 60)
 
-    def test_mock_adapter_simulates_error(self):
+    def test_mock_adapter_simulates_error(self, get_mock_adapter):
         """Test mock adapter can simulate error."""
-        adapter = MockAdapter(
+        adapter = get_mock_adapter(
             should_error=True,
             error_message="Simulated failure",
         )
 
         with pytest.raises(ExecutionError) as exc_info:
-            adapter.execute("do thing", Path("/tmp"), 60)
+            adapter.execute("do thing", _TMP, 60)
 
         assert "Simulated failure" in str(exc_info.value)
 
-    def test_mock_adapter_type(self):
+    def test_mock_adapter_type(self, mock_adapter):
         """Test mock adapter reports correct type."""
-        adapter = MockAdapter()
-        assert adapter.agent_type == AgentType.MOCK
+        assert mock_adapter.agent_type == AgentType.MOCK
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Real directory shared by tests whose subprocess calls are mocked."""
+    return tmp_path_factory.mktemp("claude_mocked")
 
 
 class TestClaudeAdapter:
     """Test Claude adapter (without actually running claude)."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_path_cache(self):
+        """Keep cached CLI lookups from leaking between patched tests."""
+        ClaudeAdapter.invalidate_path_cache()
+        yield
+        ClaudeAdapter.invalidate_path_cache()
+
     def test_claude_adapter_type(self):
         """Test Claude adapter reports correct type."""
         config = AgentConfig()
@@ -459,7 +577,7 @@ class TestClaudeAdapter:
 
     @patch("subprocess.run")
     @patch("shutil.which")
-    def test_claude_adapter_execute_success(self, mock_which, mock_run):
+    def test_claude_adapter_execute_success(self, mock_which, mock_run, shared_tmp):
         """Test Claude adapter execution (mocked)."""
         mock_which.return_value = "/usr/local/bin/claude"
         mock_run.return_value = MagicMock(
@@ -471,8 +589,7 @@ class TestClaudeAdapter:
         config = AgentConfig()
         adapter = ClaudeAdapter(config)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            response = adapter.execute("Fix the bug", Path(tmpdir), 60)
+        response = adapter.execute("Fix the bug", shared_tmp, 60)
 
         assert response.output == "Task completed"
         assert response.exit_code == 0
@@ -487,20 +604,34 @@ class TestClaudeAdapter:
         adapter = ClaudeAdapter(config)
 
         with pytest.raises(ExecutionError) as exc_info:
-            adapter.execute("Fix bug", Path("/tmp"), 60)
+            adapter.execute("Fix bug", _TMP, 60)
 
         assert "not found" in str(exc_info.value).lower()
 
+    @patch("shutil.which")
+    def test_claude_adapter_shares_path_lookup(self, mock_which):
+        """Test adapters reuse one PATH lookup until invalidated."""
+        mock_which.return_value = "/usr/local/bin/claude"
+
+        assert ClaudeAdapter(AgentConfig()).validate_environment()
+        assert ClaudeAdapter(AgentConfig()).validate_environment()
+        assert mock_which.call_count == 1
+
+        ClaudeAdapter.invalidate_path_cache()
+        assert ClaudeAdapter(AgentConfig()).validate_environment()
+        assert mock_which.call_count == 2
+
 
 # ============================================================================
 # Integration Tests
 # ============================================================================
 
 
+@pytest.mark.integration
 class TestExecutionIntegration:
     """Integration tests for execution layer."""
 
-    def test_environment_with_mock_adapter(self):
+    def test_environment_with_mock_adapter(self, get_mock_adapter, setup_template):
         """Test running mock adapter in environment."""
         scenario = Scenario(
             id="integration-001",
@@ -514,9 +645,9 @@ class TestExecutionIntegration:
         )
 
         config = ExecutionConfig(cleanup_on_success=True)
-        adapter = MockAdapter(response_output="Fixed!")
+        adapter = get_mock_adapter(response_output="Fixed!")
 
-        with Environment(scenario, config) as env:
+        with Environment(scenario, config, template=setup_template(scenario)) as env:
             # Verify environment is set up
             assert (env.workdir / "main.py").exists()
 
@@ -530,7 +661,7 @@ class TestExecutionIntegration:
             assert response.success
             assert adapter.last_call["prompt"] == "Fix the code"
 
-    def test_retry_with_environment(self):
+    def test_retry_with_environment(self, mock_adapter, setup_template):
         """Test retry logic with environment."""
         scenario = Scenario(
             id="retry-001",
@@ -545,16 +676,15 @@ class TestExecutionIntegration:
         retry_manager = RetryManager(agent_config)
 
         call_count = 0
-        adapter = MockAdapter()
 
         def run_with_retry():
             nonlocal call_count
             call_count += 1
             if call_count < 2:
                 raise ValueError("Transient failure")
-            return adapter.execute("prompt", Path("/tmp"), 60)
+            return mock_adapter.execute("prompt", _TMP, 60)
 
-        with Environment(scenario, exec_config):
+        with Environment(scenario, exec_config, template=setup_template(scenario)):
             response = retry_manager.execute_with_retry(run_with_retry, "agent run")
 
         assert response.success
@@ -1,10 +1,13 @@
 """Bootstrap Claude Code files from a project plan."""
 
 import json
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from .client import Message, get_client
 
@@ -126,6 +129,48 @@ Format as a markdown list with categories:
 Output 10-15 specific invariants. Be concrete, not generic.
 Output ONLY the markdown content, no wrapper fences."""
 
+def _instructions(prompt: str) -> str:
+    """Strip the input blocks from a per-file prompt, leaving its instructions."""
+    for block in ("PLAN:\n{plan_content}\n\n", "INVARIANTS:\n{invariants}\n\n"):
+        prompt = prompt.replace(block, "")
+    # Escape braces so the text survives COMBINED_BOOTSTRAP_PROMPT.format()
+    return prompt.replace("{", "{{").replace("}", "}}")
+
+
+# The per-file prompts above are the source of truth; the combined prompt
+# reuses their instructions and templates verbatim around a single plan.
+COMBINED_BOOTSTRAP_PROMPT = f"""Generate three files for a Claude Code project in one response, from this project plan.
+
+PLAN:
+{{plan_content}}
+
+Write each file's markdown inside its tag, in this order, with nothing outside the tags:
+
+<INVARIANTS>
+...
+</INVARIANTS>
+<CLAUDE_MD>
+...
+</CLAUDE_MD>
+<STATE_MD>
+...
+</STATE_MD>
+
+=== <INVARIANTS> ===
+{_instructions(INVARIANTS_PROMPT)}
+
+=== <CLAUDE_MD> ===
+Use the invariants you wrote in <INVARIANTS> as this file's invariants.
+
+{_instructions(CLAUDE_MD_PROMPT)}
+
+=== <STATE_MD> ===
+{_instructions(STATE_MD_PROMPT)}
+
+The "Output ONLY the markdown content" rules above apply to what goes inside each tag."""
+
+_BOOTSTRAP_SECTIONS = ("INVARIANTS", "CLAUDE_MD", "STATE_MD")
+
 
 # =============================================================================
 # DEFAULT SETTINGS
@@ -224,6 +269,45 @@ def generate_state_md(plan_content: str, verbose: bool = False) -> str:
     return result.content
 
 
+def generate_all_bootstrap(
+    plan_content: str,
+    verbose: bool = False,
+) -> Optional[Tuple[str, str, str]]:
+    """Generate invariants, CLAUDE.md and STATE.md in a single LLM call.
+
+    The three outputs share the whole plan as input, so one request avoids
+    sending (and the model re-reading) the plan three times.
+
+    Returns:
+        (invariants, claude_md, state_md), or None if the response is
+        missing a section
+    """
+    if verbose:
+        print("Generating invariants, CLAUDE.md and STATE.md...")
+
+    client = get_client()
+    prompt = COMBINED_BOOTSTRAP_PROMPT.format(plan_content=plan_content)
+
+    result = client.complete(
+        [
+            Message(role="system", content="You generate Claude Code project configuration files."),
+            Message(role="user", content=prompt),
+        ],
+        model="anthropic/claude-sonnet-4",
+        timeout=180.0,
+    )
+
+    sections = []
+    for tag in _BOOTSTRAP_SECTIONS:
+        match = re.search(rf"<{tag}>(.*?)</{tag}>", result.content, re.DOTALL)
+        if not match or not match.group(1).strip():
+            return None
+        sections.append(match.group(1).strip() + "\n")
+
+    invariants, claude_md, state_md = sections
+    return invariants, claude_md, state_md
+
+
 def generate_log_md() -> str:
     """Generate LOG.md with initial entry."""
     today = date.today().isoformat()
@@ -247,7 +331,11 @@ def copy_commands_from_home(dest_dir: Path, verbose: bool = False) -> bool:
     Returns True if any commands were copied.
     """
     home_commands = Path.home() / ".claude" / "commands"
-    if not home_commands.exists():
+    try:
+        # One directory read instead of an exists() check per command
+        with os.scandir(home_commands) as entries:
+            available = {e.name for e in entries if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
     dest_dir.mkdir(parents=True, exist_ok=True)
@@ -256,13 +344,13 @@ def copy_commands_from_home(dest_dir: Path, verbose: bool = False) -> bool:
     copied = False
 
     for cmd in commands:
-        src = home_commands / f"{cmd}.md"
-        if src.exists():
-            dest = dest_dir / f"{cmd}.md"
+        name = f"{cmd}.md"
+        if name in available:
+            dest = dest_dir / name
             if not dest.exists():
-                shutil.copy(src, dest)
+                shutil.copyfile(home_commands / name, dest)
                 if verbose:
-                    print(f"  Copied {cmd}.md")
+                    print(f"  Copied {name}")
                 copied = True
 
     return copied
@@ -278,12 +366,20 @@ def generate_claude_files(plan_content: str, verbose: bool = False) -> None:
     - .claude/settings.json
     - .claude/commands/*.md (copied from ~/.claude/commands/ if available)
     """
-    # Generate invariants first (1 API call)
-    invariants = generate_invariants(plan_content, verbose=verbose)
-
-    # Generate LLM files (2 API calls)
-    claude_md = generate_claude_md(plan_content, invariants, verbose=verbose)
-    state_md = generate_state_md(plan_content, verbose=verbose)
+    # Generate LLM files in one API call
+    generated = generate_all_bootstrap(plan_content, verbose=verbose)
+    if generated is not None:
+        _, claude_md, state_md = generated
+    else:
+        # Fall back to one call per file. STATE.md only needs the plan, so
+        # it runs alongside invariants -> CLAUDE.md instead of after them.
+        if verbose:
+            print("Combined response incomplete, generating files separately...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            state_future = executor.submit(generate_state_md, plan_content, verbose)
+            invariants = generate_invariants(plan_content, verbose=verbose)
+            claude_md = generate_claude_md(plan_content, invariants, verbose=verbose)
+            state_md = state_future.result()
     log_md = generate_log_md()
 
     # Write main files
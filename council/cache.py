@@ -0,0 +1,106 @@
+"""On-disk cache for LLM completions.
+
+Opt-in via COUNCIL_CACHE=1. Entries live in ~/.council/cache/<hash>.json,
+keyed on the exact request (model, messages, max_tokens), and expire after
+COUNCIL_CACHE_TTL seconds (default: 7 days). System prompts are part of the
+messages, so editing a prompt naturally misses the old entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_DIR = Path.home() / ".council" / "cache"
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# Bump when the entry format or key derivation changes
+CACHE_VERSION = 1
+
+
+def cache_enabled() -> bool:
+    """Whether completion caching is turned on (COUNCIL_CACHE=1)."""
+    return os.environ.get("COUNCIL_CACHE") == "1"
+
+
+def cache_ttl() -> int:
+    """Entry lifetime in seconds from COUNCIL_CACHE_TTL."""
+    try:
+        return int(os.environ.get("COUNCIL_CACHE_TTL", DEFAULT_TTL))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Hash a completion request into a cache key."""
+    request = {
+        "version": CACHE_VERSION,
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+    }
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def get(key: str, cache_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Look up a cached response.
+
+    Returns:
+        The stored response dict, or None on a miss. Expired or unreadable
+        entries count as misses and are removed.
+    """
+    path = (cache_dir or CACHE_DIR) / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        path.unlink(missing_ok=True)
+        return None
+
+    if entry.get("inputHash") != key or entry.get("expiresAt", 0) < time.time():
+        path.unlink(missing_ok=True)
+        return None
+
+    return entry.get("response")
+
+
+def put(
+    key: str,
+    model: str,
+    response: Dict[str, Any],
+    ttl: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> None:
+    """Store a response. Failures to write are ignored."""
+    directory = cache_dir or CACHE_DIR
+    now = time.time()
+    entry = {
+        "inputHash": key,
+        "modelId": model,
+        "response": response,
+        "createdAt": now,
+        "expiresAt": now + (cache_ttl() if ttl is None else ttl),
+    }
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, directory / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
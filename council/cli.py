@@ -7,8 +7,6 @@ from typing import Optional
 
 import click
 
-from .council import run_council, DEFAULT_MODELS, DEFAULT_CHAIR
-
 # Log directory
 LOG_DIR = Path.home() / ".council" / "logs"
 
@@ -20,6 +18,11 @@ def cli():
     pass
 
 
+def _echo_chunk(chunk: str) -> None:
+    """Print a streamed chunk of model output without a trailing newline."""
+    click.echo(chunk, nl=False)
+
+
 def load_context_files(context_paths: Optional[str]) -> Optional[str]:
     """Load and concatenate context files."""
     if not context_paths:
@@ -73,6 +76,8 @@ def plan(idea: str, models: Optional[str], chair: Optional[str], output: str, co
         council plan "build a CLI that converts markdown to PDF"
         council plan "add auth to my app" --context README.md,src/app.py
     """
+    from .council import run_council, DEFAULT_MODELS, DEFAULT_CHAIR
+
     # Parse models if provided
     model_list = models.split(",") if models else None
 
@@ -88,7 +93,16 @@ def plan(idea: str, models: Optional[str], chair: Optional[str], output: str, co
         click.echo()
 
     try:
-        result = run_council(idea, models=model_list, chair=chair, mode="plan", verbose=verbose, context=context_content)
+        result = run_council(
+            idea,
+            models=model_list,
+            chair=chair,
+            mode="plan",
+            verbose=verbose,
+            context=context_content,
+            stream_cb=_echo_chunk,
+        )
+        click.echo()
         Path(output).write_text(result)
         click.echo(f"\nPlan written to {output}")
     except Exception as e:
@@ -124,10 +138,20 @@ def debate(question: str, models: Optional[str], chair: Optional[str], append: b
     Example:
         council debate "REST vs GraphQL for a simple CRUD API"
     """
+    from .council import run_council
+
     model_list = models.split(",") if models else None
 
     try:
-        result = run_council(question, models=model_list, chair=chair, mode="debate", verbose=verbose)
+        # Stream the synthesis to stdout unless it's going to PLAN.md
+        result = run_council(
+            question,
+            models=model_list,
+            chair=chair,
+            mode="debate",
+            verbose=verbose,
+            stream_cb=None if append else _echo_chunk,
+        )
 
         if append:
             plan_path = Path("PLAN.md")
@@ -139,7 +163,7 @@ def debate(question: str, models: Optional[str], chair: Optional[str], append: b
                 click.echo("PLAN.md not found, outputting to stdout:\n")
                 click.echo(result)
         else:
-            click.echo(result)
+            click.echo()
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -218,6 +242,8 @@ def refine(instruction: str, plan: str, models: Optional[str], chair: Optional[s
         council refine "focus more on security considerations"
         council refine "simplify the architecture, we don't need microservices"
     """
+    from .council import run_council
+
     plan_path = Path(plan)
     if not plan_path.exists():
         click.echo(f"Error: {plan} not found. Run 'council plan' first.", err=True)
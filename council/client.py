@@ -1,21 +1,93 @@
 """OpenRouter API client for multi-model calls."""
 
+import asyncio
+import atexit
+import functools
+import json
 import os
-from dataclasses import dataclass
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import httpx
-from dotenv import load_dotenv
 
-# Load .env from current directory or home
-load_dotenv()
-load_dotenv(Path.home() / ".env")
+from . import cache
+from .ratelimit import (
+    CHARS_PER_TOKEN,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_TPM_LIMIT,
+    Reservation,
+    TokenBudgetTracker,
+    estimate_tokens,
+    max_concurrent_from_env,
+    tpm_limit_from_env,
+)
+
+# orjson parses large completion bodies several times faster; the stdlib
+# parser reads the same bytes when it isn't installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# One pooled HTTP client per process, so repeated completions to OpenRouter
+# reuse keep-alive connections instead of a fresh TCP+TLS handshake each time
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+_shared_http: Optional[httpx.Client] = None
+_shared_http_lock = threading.Lock()
+
+
+def _get_http() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _shared_http
+    if _shared_http is None:
+        with _shared_http_lock:
+            if _shared_http is None:
+                _shared_http = httpx.Client(
+                    limits=_HTTP_LIMITS,
+                    timeout=httpx.Timeout(120.0),
+                )
+    return _shared_http
+
+
+def _close_http() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _shared_http
+    if _shared_http is not None:
+        _shared_http.close()
+        _shared_http = None
+
+
+atexit.register(_close_http)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load .env from the current directory or home, once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    load_dotenv(Path.home() / ".env")
+
+
+# Rate limits and upstream hiccups are retried with backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_MAX_RETRY_DELAY = 30.0
 
 
 @dataclass
 class Message:
     """A chat message."""
+    __slots__ = ("role", "content")
+
     role: str  # "system", "user", "assistant"
     content: str
 
@@ -41,14 +113,32 @@ class OpenRouterClient:
 
     BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize client with API key from param or environment."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        tpm_limit: int = DEFAULT_TPM_LIMIT,
+    ):
+        """Initialize client with API key from param or environment.
+
+        Args:
+            api_key: OpenRouter key (default: OPENROUTER_API_KEY)
+            max_concurrent: Most requests in flight at once
+            tpm_limit: Tokens per minute to pace requests under (0: no pacing)
+        """
+        _load_env()
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
         if not self.api_key:
             raise OpenRouterError(
                 "OPENROUTER_API_KEY environment variable is required.\n"
                 "Get one at: https://openrouter.ai/keys"
             )
+        self._async_http: Optional[httpx.AsyncClient] = None
+        self.max_concurrent = max_concurrent
+        self._sem = threading.BoundedSemaphore(max_concurrent)
+        # Created on first async use so it binds to the running event loop
+        self._async_sem: Optional[asyncio.Semaphore] = None
+        self._tpm = TokenBudgetTracker(tpm_limit)
 
     def complete(
         self,
@@ -60,6 +150,53 @@ class OpenRouterClient:
         """
         Execute a chat completion.
 
+        429 and 5xx responses are retried with backoff. With COUNCIL_CACHE=1,
+        identical requests are answered from the on-disk cache (see
+        council.cache). COUNCIL_MAX_CONCURRENT and COUNCIL_TPM_LIMIT set
+        the client-side rate limits (see council.ratelimit).
+
+        Args:
+            messages: List of chat messages
+            model: Model identifier (e.g., "anthropic/claude-sonnet-4-20250514")
+            timeout: Request timeout in seconds
+            max_tokens: Maximum output tokens
+
+        Returns:
+            CompletionResult with content and metadata
+
+        Raises:
+            OpenRouterError: On API or network errors
+        """
+        payload = self._payload(messages, model, max_tokens)
+        key = self._cache_key(payload)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return CompletionResult(**cached)
+
+        estimate = estimate_tokens(payload["messages"], max_tokens)
+        with self._open(payload, timeout, estimate) as (response, reservation):
+            data = _json_loads(response.read())
+            result = self._parse_result(data, model)
+            self._record_usage(reservation, result.usage, estimate)
+
+        if key is not None:
+            cache.put(key, model, asdict(result))
+        return result
+
+    async def complete_async(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: float = 120.0,
+        max_tokens: Optional[int] = None,
+    ) -> CompletionResult:
+        """
+        Execute a chat completion without blocking the event loop.
+
+        Concurrent calls on one client share a single connection pool.
+        Call aclose() when done.
+
         Args:
             messages: List of chat messages
             model: Model identifier (e.g., "anthropic/claude-sonnet-4-20250514")
@@ -72,14 +209,229 @@ class OpenRouterClient:
         Raises:
             OpenRouterError: On API or network errors
         """
-        headers = {
+        payload = self._payload(messages, model, max_tokens)
+        key = self._cache_key(payload)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return CompletionResult(**cached)
+
+        estimate = estimate_tokens(payload["messages"], max_tokens)
+        async with self._open_async(payload, timeout, estimate) as (response, reservation):
+            data = _json_loads(await response.aread())
+            result = self._parse_result(data, model)
+            self._record_usage(reservation, result.usage, estimate)
+
+        if key is not None:
+            cache.put(key, model, asdict(result))
+        return result
+
+    def complete_stream(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: float = 120.0,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Execute a chat completion, yielding content chunks as they arrive.
+
+        Args:
+            messages: List of chat messages
+            model: Model identifier (e.g., "anthropic/claude-sonnet-4-20250514")
+            timeout: Request timeout in seconds
+            max_tokens: Maximum output tokens
+
+        Yields:
+            Content text chunks, in order
+
+        Raises:
+            OpenRouterError: On API or network errors
+        """
+        payload = self._payload(messages, model, max_tokens)
+        key = self._cache_key(payload)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached["content"]
+                return
+
+        estimate = estimate_tokens(payload["messages"], max_tokens)
+        parts: List[str] = []
+        with self._open({**payload, "stream": True}, timeout, estimate) as (response, reservation):
+            for line in response.iter_lines():
+                chunk = self._parse_stream_line(line)
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+            output = len("".join(parts)) // CHARS_PER_TOKEN
+            self._record_usage(reservation, None, estimate + output)
+
+        self._finish_stream(key, model, parts)
+
+    async def complete_stream_async(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: float = 120.0,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async version of complete_stream.
+
+        Args:
+            messages: List of chat messages
+            model: Model identifier (e.g., "anthropic/claude-sonnet-4-20250514")
+            timeout: Request timeout in seconds
+            max_tokens: Maximum output tokens
+
+        Yields:
+            Content text chunks, in order
+
+        Raises:
+            OpenRouterError: On API or network errors
+        """
+        payload = self._payload(messages, model, max_tokens)
+        key = self._cache_key(payload)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached["content"]
+                return
+
+        estimate = estimate_tokens(payload["messages"], max_tokens)
+        parts: List[str] = []
+        stream_payload = {**payload, "stream": True}
+        async with self._open_async(stream_payload, timeout, estimate) as (response, reservation):
+            async for line in response.aiter_lines():
+                chunk = self._parse_stream_line(line)
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+            output = len("".join(parts)) // CHARS_PER_TOKEN
+            self._record_usage(reservation, None, estimate + output)
+
+        self._finish_stream(key, model, parts)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool, if one was opened."""
+        if self._async_http is not None:
+            await self._async_http.aclose()
+            self._async_http = None
+        self._async_sem = None
+
+    @contextmanager
+    def _open(
+        self,
+        payload: Dict[str, Any],
+        timeout: float,
+        estimate: int,
+    ) -> Iterator[Tuple[httpx.Response, Reservation]]:
+        """Send a request under the rate limits, retrying transient failures.
+
+        Holds a concurrency slot for as long as the caller reads the
+        response, and reserves `estimate` tokens before sending so
+        concurrent requests are paced. The caller settles the reservation
+        with actual usage (see _record_usage); if the request fails first,
+        the reservation is released. 429/5xx statuses are retried before
+        anything is handed to the caller, so streamed content is never
+        replayed.
+
+        Yields:
+            (response, reservation), response body not yet read
+
+        Raises:
+            OpenRouterError: On API or network errors
+        """
+        with self._sem:
+            reservation = self._tpm.wait_for_budget(estimate)
+            try:
+                for attempt in range(_MAX_ATTEMPTS):
+                    try:
+                        with _get_http().stream(
+                            "POST",
+                            self.BASE_URL,
+                            headers=self._headers(),
+                            json=payload,
+                            timeout=timeout,
+                        ) as response:
+                            if not self._should_retry(response, attempt):
+                                if response.is_error:
+                                    response.read()
+                                    response.raise_for_status()
+                                yield response, reservation
+                                return
+                    except httpx.HTTPError as e:
+                        raise self._request_error(e, timeout)
+                    time.sleep(self._retry_delay(response, attempt))
+            finally:
+                # No-op once the caller has settled it
+                reservation.release()
+
+    @asynccontextmanager
+    async def _open_async(
+        self,
+        payload: Dict[str, Any],
+        timeout: float,
+        estimate: int,
+    ) -> AsyncIterator[Tuple[httpx.Response, Reservation]]:
+        """Async version of _open."""
+        if self._async_http is None:
+            self._async_http = httpx.AsyncClient(limits=_HTTP_LIMITS)
+        if self._async_sem is None:
+            self._async_sem = asyncio.Semaphore(self.max_concurrent)
+
+        async with self._async_sem:
+            reservation = await self._tpm.wait_for_budget_async(estimate)
+            try:
+                for attempt in range(_MAX_ATTEMPTS):
+                    try:
+                        async with self._async_http.stream(
+                            "POST",
+                            self.BASE_URL,
+                            headers=self._headers(),
+                            json=payload,
+                            timeout=timeout,
+                        ) as response:
+                            if not self._should_retry(response, attempt):
+                                if response.is_error:
+                                    await response.aread()
+                                    response.raise_for_status()
+                                yield response, reservation
+                                return
+                    except httpx.HTTPError as e:
+                        raise self._request_error(e, timeout)
+                    await asyncio.sleep(self._retry_delay(response, attempt))
+            finally:
+                reservation.release()
+
+    @staticmethod
+    def _record_usage(
+        reservation: Reservation,
+        usage: Optional[Dict[str, Any]],
+        estimate: int,
+    ) -> None:
+        """Settle a finished request's reservation with its actual usage."""
+        total = (usage or {}).get("total_tokens")
+        reservation.settle(total if isinstance(total, int) else estimate)
+
+    def _headers(self) -> Dict[str, str]:
+        """Build request headers."""
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/council-cli",
             "X-Title": "Council CLI",
         }
 
-        payload = {
+    @staticmethod
+    def _payload(
+        messages: List[Message],
+        model: str,
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the chat completion request body."""
+        payload: Dict[str, Any] = {
             "model": model,
             "messages": [{"role": m.role, "content": m.content} for m in messages],
         }
@@ -87,32 +439,91 @@ class OpenRouterClient:
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
 
-        try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
+        return payload
 
-        except httpx.TimeoutException:
-            raise OpenRouterError(
+    @staticmethod
+    def _should_retry(response: httpx.Response, attempt: int) -> bool:
+        """Whether a response is a transient failure worth another attempt."""
+        return response.status_code in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before the next attempt.
+
+        Honors a numeric Retry-After header, otherwise backs off
+        exponentially (1s, 2s, 4s, ...), capped at _MAX_RETRY_DELAY.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return min(2.0 ** attempt, _MAX_RETRY_DELAY)
+
+    @staticmethod
+    def _cache_key(payload: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a request body, or None when caching is off."""
+        if not cache.cache_enabled():
+            return None
+        return cache.cache_key(
+            payload["model"], payload["messages"], payload.get("max_tokens")
+        )
+
+    @staticmethod
+    def _request_error(e: httpx.HTTPError, timeout: float) -> OpenRouterError:
+        """Translate an httpx error into an OpenRouterError."""
+        if isinstance(e, httpx.TimeoutException):
+            return OpenRouterError(
                 f"Request timed out after {timeout}s. "
                 "Try again or use a faster model."
             )
-        except httpx.HTTPStatusError as e:
+        if isinstance(e, httpx.HTTPStatusError):
             try:
                 error_data = e.response.json()
                 error_msg = error_data.get("error", {}).get("message", str(e))
             except Exception:
                 error_msg = str(e)
+            return OpenRouterError(f"API error: {error_msg}")
+        return OpenRouterError(f"Network error: {e}")
+
+    @staticmethod
+    def _parse_stream_line(line: str) -> Optional[str]:
+        """Extract the content delta from one server-sent event line.
+
+        Returns None for comments, keep-alives, and the final [DONE] marker.
+        """
+        if not line.startswith("data: "):
+            return None
+        data = line[len("data: "):]
+        if data == "[DONE]":
+            return None
+
+        try:
+            event = _json_loads(data)
+        except ValueError:
+            raise OpenRouterError(f"Unexpected stream event: {data[:100]}")
+
+        if "error" in event:
+            error = event["error"]
+            error_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
             raise OpenRouterError(f"API error: {error_msg}")
-        except httpx.RequestError as e:
-            raise OpenRouterError(f"Network error: {e}")
 
-        # Extract response
+        choices = event.get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content")
+
+    @staticmethod
+    def _finish_stream(key: Optional[str], model: str, parts: List[str]) -> None:
+        """Validate a completed stream and cache its full content."""
+        content = "".join(parts)
+        if not content:
+            raise OpenRouterError("Empty content in API response")
+        if key is not None:
+            cache.put(key, model, {"content": content, "model": model, "usage": None})
+
+    @staticmethod
+    def _parse_result(data: Dict[str, Any], model: str) -> CompletionResult:
+        """Extract the completion from an API response body."""
         try:
             choices = data.get("choices", [])
             if not choices:
@@ -135,5 +546,13 @@ class OpenRouterClient:
 
 
 def get_client(api_key: Optional[str] = None) -> OpenRouterClient:
-    """Get an OpenRouter client instance."""
-    return OpenRouterClient(api_key)
+    """Get an OpenRouter client instance.
+
+    Rate limits come from COUNCIL_MAX_CONCURRENT and COUNCIL_TPM_LIMIT.
+    """
+    _load_env()
+    return OpenRouterClient(
+        api_key,
+        max_concurrent=max_concurrent_from_env(),
+        tpm_limit=tpm_limit_from_env(),
+    )
@@ -1,7 +1,10 @@
 """Core council logic - multi-model draft, critique, and synthesis."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import os
+from typing import (
+    AsyncIterator, Awaitable, Callable, Collection, Dict, List, Optional, Tuple,
+)
 
 from .client import CompletionResult, Message, OpenRouterClient, get_client
 
@@ -13,6 +16,15 @@ DEFAULT_MODELS = [
 ]
 DEFAULT_CHAIR = "anthropic/claude-opus-4.5"
 
+# Once a phase has enough results, how long to keep waiting on slower models
+MAX_STRAGGLER_WAIT = 60.0
+
+# Opt-in: drafts longer than this in total (chars) are condensed before
+# critique, since every critic receives all of them. 0 (the default) keeps
+# critics on the full drafts; override with COUNCIL_COMPRESS_THRESHOLD.
+COMPRESS_THRESHOLD = 0
+COMPRESS_MODEL = "openai/gpt-4o-mini"
+
 
 # =============================================================================
 # PROMPTS
@@ -44,6 +56,11 @@ CRITIQUE_SYSTEM_PROMPT = """You are a senior engineer reviewing draft proposals.
 
 Focus on substance, not style."""
 
+COMPRESS_SYSTEM_PROMPT = """Condense the following proposal to at most 500 words for a reviewer.
+
+Preserve every concrete claim, decision, technology choice, trade-off and risk.
+Drop repetition, pleasantries and formatting flourishes. Output only the condensed proposal."""
+
 CHAIR_PLAN_PROMPT = """You are synthesizing perspectives from multiple models into a unified project plan.
 
 ## Drafts
@@ -123,18 +140,20 @@ Output the complete refined plan in clean markdown."""
 # CORE FUNCTIONS
 # =============================================================================
 
-def draft_one(
-    client: OpenRouterClient,
-    model: str,
+def _format_sections(label: str, outputs: Dict[str, str]) -> str:
+    """Format per-model outputs as markdown sections, one per model."""
+    return "".join(
+        f"\n### {label} from {model}\n\n{content}\n\n---\n"
+        for model, content in outputs.items()
+    )
+
+
+def _draft_messages(
     prompt: str,
     mode: str,
     context: Optional[str] = None,
-) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
-    """Generate a single draft from one model.
-
-    Returns:
-        (model, result or None, error or None)
-    """
+) -> List[Message]:
+    """Build the messages for one model's draft."""
     if mode == "plan":
         system_prompt = PLAN_SYSTEM_PROMPT
     elif mode == "refine":
@@ -150,72 +169,54 @@ def draft_one(
     else:
         user_content = prompt
 
-    messages = [
+    return [
         Message(role="system", content=system_prompt),
         Message(role="user", content=user_content),
     ]
 
-    try:
-        result = client.complete(messages, model=model, timeout=120.0)
-        return (model, result, None)
-    except Exception as e:
-        return (model, None, str(e))
-
 
-def critique_drafts(
-    client: OpenRouterClient,
-    model: str,
+def _critique_messages(
     drafts: Dict[str, str],
     original_prompt: str,
-) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
-    """Generate a critique of all drafts from one model.
+    condensed: Collection[str] = (),
+) -> List[Message]:
+    """Build the messages for one model's critique of all drafts.
 
-    Returns:
-        (model, result or None, error or None)
+    Drafts by models in `condensed` are summaries, and are labelled as such
+    so critics don't mistake omitted detail for gaps in the original.
     """
     # Format drafts for critique
-    drafts_text = ""
-    for draft_model, content in drafts.items():
-        drafts_text += f"\n### Draft from {draft_model}\n\n{content}\n\n---\n"
-
-    messages = [
+    drafts_text = "".join(
+        f"\n### Draft from {model}{' (condensed)' if model in condensed else ''}"
+        f"\n\n{content}\n\n---\n"
+        for model, content in drafts.items()
+    )
+    note = (
+        "\n\nDrafts marked (condensed) were summarized by another model to save "
+        "space. Critique their substance; don't treat missing detail as a gap "
+        "in the original proposal."
+        if condensed else ""
+    )
+
+    return [
         Message(role="system", content=CRITIQUE_SYSTEM_PROMPT),
         Message(
             role="user",
-            content=f"## Original Request\n{original_prompt}\n\n## Drafts to Review\n{drafts_text}\n\nProvide your critique.",
+            content=f"## Original Request\n{original_prompt}\n\n## Drafts to Review\n{drafts_text}{note}\n\nProvide your critique.",
         ),
     ]
 
-    try:
-        result = client.complete(messages, model=model, timeout=120.0)
-        return (model, result, None)
-    except Exception as e:
-        return (model, None, str(e))
-
 
-def synthesize(
-    client: OpenRouterClient,
-    chair_model: str,
+def _synthesis_messages(
     drafts: Dict[str, str],
     critiques: Dict[str, str],
     original_prompt: str,
     mode: str,
     context: Optional[str] = None,
-) -> str:
-    """Chair synthesis of drafts and critiques.
-
-    Returns:
-        Synthesized content string
-    """
-    # Format drafts
-    drafts_text = ""
-    for model, content in drafts.items():
-        drafts_text += f"\n### Draft from {model}\n\n{content}\n\n---\n"
-
-    # Format critiques
-    critiques_text = ""
-    for model, content in critiques.items():
-        critiques_text += f"\n### Critique from {model}\n\n{content}\n\n---\n"
+) -> List[Message]:
+    """Build the chair's synthesis messages."""
+    drafts_text = _format_sections("Draft", drafts)
+    critiques_text = _format_sections("Critique", critiques)
 
     # Choose prompt template based on mode
     if mode == "plan":
@@ -238,13 +239,239 @@ def synthesize(
             original_prompt=original_prompt,
         )
 
-    messages = [
+    return [
         Message(role="system", content="You are the chair synthesizing council input into a final output."),
         Message(role="user", content=user_prompt),
     ]
 
-    result = client.complete(messages, model=chair_model, timeout=180.0)
-    return result.content
+
+def draft_one(
+    client: OpenRouterClient,
+    model: str,
+    prompt: str,
+    mode: str,
+    context: Optional[str] = None,
+) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
+    """Generate a single draft from one model.
+
+    Returns:
+        (model, result or None, error or None)
+    """
+    messages = _draft_messages(prompt, mode, context)
+
+    try:
+        result = client.complete(messages, model=model, timeout=120.0)
+        return (model, result, None)
+    except Exception as e:
+        return (model, None, str(e))
+
+
+async def draft_one_async(
+    client: OpenRouterClient,
+    model: str,
+    prompt: str,
+    mode: str,
+    context: Optional[str] = None,
+) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
+    """Async version of draft_one.
+
+    Returns:
+        (model, result or None, error or None)
+    """
+    return await _complete_one_async(client, model, _draft_messages(prompt, mode, context))
+
+
+def critique_drafts(
+    client: OpenRouterClient,
+    model: str,
+    drafts: Dict[str, str],
+    original_prompt: str,
+) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
+    """Generate a critique of all drafts from one model.
+
+    Returns:
+        (model, result or None, error or None)
+    """
+    messages = _critique_messages(drafts, original_prompt)
+
+    try:
+        result = client.complete(messages, model=model, timeout=120.0)
+        return (model, result, None)
+    except Exception as e:
+        return (model, None, str(e))
+
+
+async def critique_drafts_async(
+    client: OpenRouterClient,
+    model: str,
+    drafts: Dict[str, str],
+    original_prompt: str,
+) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
+    """Async version of critique_drafts.
+
+    Returns:
+        (model, result or None, error or None)
+    """
+    return await _complete_one_async(client, model, _critique_messages(drafts, original_prompt))
+
+
+def compress_threshold_from_env() -> int:
+    """Draft compression threshold from COUNCIL_COMPRESS_THRESHOLD (0: off)."""
+    try:
+        return max(0, int(os.environ.get("COUNCIL_COMPRESS_THRESHOLD", COMPRESS_THRESHOLD)))
+    except ValueError:
+        return COMPRESS_THRESHOLD
+
+
+async def compress_drafts_async(
+    client: OpenRouterClient,
+    drafts: Dict[str, str],
+    threshold: int,
+    model: str = COMPRESS_MODEL,
+) -> Tuple[Dict[str, str], List[str]]:
+    """Condense drafts for the critique phase when they're too large.
+
+    If `threshold` is positive and the drafts total more than that many
+    characters, each draft longer than its even share of the threshold is
+    summarized by `model` (in parallel). Drafts whose summary fails are
+    kept as-is.
+
+    Returns:
+        (model -> draft text, summarized where needed;
+         models whose draft was replaced by a summary)
+    """
+    if threshold <= 0 or sum(len(text) for text in drafts.values()) <= threshold:
+        return drafts, []
+
+    share = threshold // len(drafts)
+    long_drafts = [author for author, text in drafts.items() if len(text) > share]
+    outcomes = await asyncio.gather(*[
+        _complete_one_async(client, model, [
+            Message(role="system", content=COMPRESS_SYSTEM_PROMPT),
+            Message(role="user", content=drafts[author]),
+        ])
+        for author in long_drafts
+    ])
+
+    compressed = dict(drafts)
+    condensed = []
+    for author, (_, result, _) in zip(long_drafts, outcomes):
+        if result and result.content.strip():
+            compressed[author] = result.content
+            condensed.append(author)
+    return compressed, condensed
+
+
+async def _as_completed_quorum(
+    calls: List[Awaitable[Tuple[str, Optional[CompletionResult], Optional[str]]]],
+    quorum: int,
+    straggler_wait: float = MAX_STRAGGLER_WAIT,
+) -> AsyncIterator[Tuple[str, Optional[CompletionResult], Optional[str]]]:
+    """Yield council member outcomes as they finish, dropping stragglers.
+
+    Once `quorum` calls have succeeded, the remaining ones get
+    `straggler_wait` more seconds; whatever is still running then is
+    cancelled, so one slow model can't hold up the whole phase.
+    """
+    loop = asyncio.get_running_loop()
+    pending = {asyncio.ensure_future(call) for call in calls}
+    succeeded = 0
+    deadline: Optional[float] = None
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                outcome = task.result()
+                if outcome[1] is not None:
+                    succeeded += 1
+                yield outcome
+            if deadline is None and succeeded >= quorum:
+                deadline = loop.time() + straggler_wait
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _complete_one_async(
+    client: OpenRouterClient,
+    model: str,
+    messages: List[Message],
+) -> Tuple[str, Optional[CompletionResult], Optional[str]]:
+    """Run one council member's completion, capturing any error.
+
+    Returns:
+        (model, result or None, error or None)
+    """
+    try:
+        result = await client.complete_async(messages, model=model, timeout=120.0)
+        return (model, result, None)
+    except Exception as e:
+        return (model, None, str(e))
+
+
+def synthesize(
+    client: OpenRouterClient,
+    chair_model: str,
+    drafts: Dict[str, str],
+    critiques: Dict[str, str],
+    original_prompt: str,
+    mode: str,
+    context: Optional[str] = None,
+    stream_cb: Optional[Callable[[str], None]] = None,
+) -> str:
+    """Chair synthesis of drafts and critiques.
+
+    Args:
+        stream_cb: If given, called with each chunk of the synthesis as it
+            streams in
+
+    Returns:
+        Synthesized content string
+    """
+    messages = _synthesis_messages(drafts, critiques, original_prompt, mode, context)
+
+    if stream_cb is None:
+        result = client.complete(messages, model=chair_model, timeout=180.0)
+        return result.content
+
+    parts: List[str] = []
+    for chunk in client.complete_stream(messages, model=chair_model, timeout=180.0):
+        stream_cb(chunk)
+        parts.append(chunk)
+    return "".join(parts)
+
+
+async def synthesize_async(
+    client: OpenRouterClient,
+    chair_model: str,
+    drafts: Dict[str, str],
+    critiques: Dict[str, str],
+    original_prompt: str,
+    mode: str,
+    context: Optional[str] = None,
+    stream_cb: Optional[Callable[[str], None]] = None,
+) -> str:
+    """Async version of synthesize.
+
+    Returns:
+        Synthesized content string
+    """
+    messages = _synthesis_messages(drafts, critiques, original_prompt, mode, context)
+
+    if stream_cb is None:
+        result = await client.complete_async(messages, model=chair_model, timeout=180.0)
+        return result.content
+
+    parts: List[str] = []
+    async for chunk in client.complete_stream_async(messages, model=chair_model, timeout=180.0):
+        stream_cb(chunk)
+        parts.append(chunk)
+    return "".join(parts)
 
 
 def run_council(
@@ -254,6 +481,8 @@ def run_council(
     mode: str = "plan",
     verbose: bool = False,
     context: Optional[str] = None,
+    stream_cb: Optional[Callable[[str], None]] = None,
+    compress_threshold: Optional[int] = None,
 ) -> str:
     """Run a multi-model council.
 
@@ -264,17 +493,60 @@ def run_council(
         mode: "plan", "debate", or "refine"
         verbose: Print progress messages
         context: Optional context (files, existing plan) to include
+        stream_cb: Optional callback receiving the chair's synthesis
+            chunk by chunk as it streams in
+        compress_threshold: Condense drafts for critics when they total
+            more than this many chars (default: COUNCIL_COMPRESS_THRESHOLD,
+            0 disables)
 
     Returns:
         Synthesized output string
 
     Flow:
         1. Draft phase: Each model generates a draft (parallel)
-        2. Critique phase: Each model critiques all drafts (parallel)
+        2. Critique phase: Each model critiques all drafts (parallel),
+           skipped when fewer than two drafts succeeded. With compression
+           enabled, oversized drafts are condensed for critics first.
         3. Synthesis phase: Chair combines everything
+
+        Drafts and critiques stop waiting on slow models MAX_STRAGGLER_WAIT
+        seconds after half the models (and at least two drafters) have
+        answered.
     """
-    models = models or DEFAULT_MODELS
+    return asyncio.run(
+        run_council_async(
+            prompt,
+            models=models,
+            chair=chair,
+            mode=mode,
+            verbose=verbose,
+            context=context,
+            stream_cb=stream_cb,
+            compress_threshold=compress_threshold,
+        )
+    )
+
+
+async def run_council_async(
+    prompt: str,
+    models: Optional[List[str]] = None,
+    chair: Optional[str] = None,
+    mode: str = "plan",
+    verbose: bool = False,
+    context: Optional[str] = None,
+    stream_cb: Optional[Callable[[str], None]] = None,
+    compress_threshold: Optional[int] = None,
+) -> str:
+    """Run a multi-model council on the current event loop.
+
+    Same arguments and flow as run_council. Each phase's calls run as
+    concurrent coroutines over one shared connection pool.
+    """
+    # A repeated model would only send identical draft and critique requests
+    models = list(dict.fromkeys(models or DEFAULT_MODELS))
     chair = chair or DEFAULT_CHAIR
+    if compress_threshold is None:
+        compress_threshold = compress_threshold_from_env()
 
     client = get_client()
 
@@ -283,21 +555,22 @@ def run_council(
         if context:
             print(f"Context provided: {len(context)} chars")
 
-    # === PHASE 1: DRAFTS (parallel) ===
-    if verbose:
-        print("Phase 1: Generating drafts...")
-
-    drafts: Dict[str, str] = {}
-    errors: List[str] = []
-
-    with ThreadPoolExecutor(max_workers=len(models)) as executor:
-        futures = {
-            executor.submit(draft_one, client, model, prompt, mode, context): model
-            for model in models
-        }
-
-        for future in as_completed(futures):
-            model, result, error = future.result()
+    try:
+        # === PHASE 1: DRAFTS (parallel) ===
+        if verbose:
+            print("Phase 1: Generating drafts...")
+
+        drafts: Dict[str, str] = {}
+        errors: List[str] = []
+
+        # Every model gets the same draft request; build it once
+        draft_messages = _draft_messages(prompt, mode, context)
+        answered = set()
+        async for model, result, error in _as_completed_quorum(
+            [_complete_one_async(client, model, draft_messages) for model in models],
+            quorum=min(len(models), max(2, (len(models) + 1) // 2)),
+        ):
+            answered.add(model)
             if result:
                 drafts[model] = result.content
                 if verbose:
@@ -307,37 +580,56 @@ def run_council(
                 if verbose:
                     print(f"  - {model}: FAILED ({error})")
 
-    if len(drafts) < 1:
-        raise RuntimeError(f"All drafts failed: {errors}")
-
-    # === PHASE 2: CRITIQUES (parallel) ===
-    if verbose:
-        print("Phase 2: Generating critiques...")
-
-    critiques: Dict[str, str] = {}
-
-    with ThreadPoolExecutor(max_workers=len(models)) as executor:
-        futures = {
-            executor.submit(critique_drafts, client, model, drafts, prompt): model
-            for model in models
-        }
-
-        for future in as_completed(futures):
-            model, result, error = future.result()
-            if result:
-                critiques[model] = result.content
-                if verbose:
-                    print(f"  - {model}: done")
-            else:
+        for model in models:
+            if model not in answered:
+                errors.append(f"{model}: timed out")
                 if verbose:
-                    print(f"  - {model}: FAILED ({error})")
-                # Critiques are optional, continue without
-
-    # === PHASE 3: SYNTHESIS ===
-    if verbose:
-        print(f"Phase 3: Chair synthesis ({chair})...")
+                    print(f"  - {model}: SKIPPED (still running after quorum)")
+
+        if len(drafts) < 1:
+            raise RuntimeError(f"All drafts failed: {errors}")
+
+        # === PHASE 2: CRITIQUES (parallel) ===
+        critiques: Dict[str, str] = {}
+
+        if len(drafts) < 2:
+            # Nothing to compare against a lone draft; go straight to synthesis
+            if verbose:
+                print("Phase 2: Skipping critiques (insufficient drafts)")
+        else:
+            if verbose:
+                print("Phase 2: Generating critiques...")
+
+            # Critics may see condensed drafts; the chair still gets the originals
+            review_drafts, condensed = await compress_drafts_async(
+                client, drafts, compress_threshold
+            )
+            if verbose and condensed:
+                print(f"  Condensed drafts for critique: {', '.join(condensed)}")
+            critique_messages = _critique_messages(review_drafts, prompt, condensed)
+            async for model, result, error in _as_completed_quorum(
+                [_complete_one_async(client, model, critique_messages) for model in models],
+                quorum=max(1, (len(models) + 1) // 2),
+            ):
+                if result:
+                    critiques[model] = result.content
+                    if verbose:
+                        print(f"  - {model}: done")
+                else:
+                    if verbose:
+                        print(f"  - {model}: FAILED ({error})")
+                    # Critiques are optional, continue without
+
+        # === PHASE 3: SYNTHESIS ===
+        if verbose:
+            print(f"Phase 3: Chair synthesis ({chair})...")
+
+        result = await synthesize_async(
+            client, chair, drafts, critiques, prompt, mode, context, stream_cb=stream_cb
+        )
 
-    result = synthesize(client, chair, drafts, critiques, prompt, mode, context)
+    finally:
+        await client.aclose()
 
     if verbose:
         print("Council complete.")
@@ -1,10 +1,11 @@
 """Git progress detection for circuit breaker."""
 
 import hashlib
+import os
 import subprocess
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 
 @dataclass
@@ -20,55 +21,124 @@ class GitSnapshot:
         return self.combined_hash == other.combined_hash
 
 
-def take_snapshot(worktree: Path) -> Optional[GitSnapshot]:
+# Read-only queries: GIT_OPTIONAL_LOCKS=0 stops `git status` from taking
+# index.lock to refresh the index (and from racing the agent's own git
+# commands); LC_ALL=C keeps output independent of the user's locale.
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+
+def _git(worktree: Union[str, Path], *args: str, timeout: float) -> subprocess.CompletedProcess:
+    """Run a read-only git command in worktree, capturing stdout as bytes.
+
+    worktree may be a str or Path; a leading ~ is expanded. Callers decode
+    only the fields they keep (paths via os.fsdecode, so filenames that
+    aren't valid UTF-8 can't raise).
     """
-    Take a snapshot of the current git state.
+    return subprocess.run(
+        ["git", "-C", os.path.expanduser(worktree), *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout,
+        env=_GIT_ENV,
+    )
+
+
+def _short_hash(data: bytes) -> str:
+    """16-hex-char digest of raw git output for snapshot comparison.
+
+    SHA-256 stays: OpenSSL runs it on the CPU's SHA extensions, which beats
+    blake2b on status-sized inputs, and it needs no extra dependency.
+    """
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+# Space-separated fields preceding the path in porcelain v2 entries:
+# ordinary changes, renames/copies, and unmerged paths
+_STATUS_PATH_FIELD = {b"1": 8, b"2": 9, b"u": 10}
+
+
+def snapshot_and_summary(worktree: Path) -> Tuple[Optional[GitSnapshot], dict]:
+    """
+    Take a snapshot and classify uncommitted changes from one git status.
 
     Args:
         worktree: Path to the git worktree
 
     Returns:
-        GitSnapshot or None if not a git repo
+        (GitSnapshot or None if not a repo / no commits yet,
+         dict with staged, unstaged, untracked file lists)
     """
-    if isinstance(worktree, str):
-        worktree = Path(worktree).expanduser()
+    summary = {
+        "staged": [],
+        "unstaged": [],
+        "untracked": [],
+    }
 
     try:
-        # Get git status (staged + unstaged changes)
-        status_result = subprocess.run(
-            ["git", "-C", str(worktree), "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if status_result.returncode != 0:
-            return None
-        status_output = status_result.stdout
-
-        # Get HEAD commit hash
-        head_result = subprocess.run(
-            ["git", "-C", str(worktree), "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if head_result.returncode != 0:
-            return None
-        head_hash = head_result.stdout.strip()
-
-        # Create hashes
-        status_hash = hashlib.sha256(status_output.encode()).hexdigest()[:16]
-        combined = f"{status_output}\n{head_hash}"
-        combined_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
-
-        return GitSnapshot(
-            status_hash=status_hash,
-            head_hash=head_hash[:12],  # Short hash for display
-            combined_hash=combined_hash,
+        # porcelain v2 --branch reports HEAD as a "# branch.oid" header ahead
+        # of the changes; -z gives NUL-terminated records with unquoted paths
+        status_result = _git(
+            worktree, "status", "--porcelain=v2", "--branch", "-z", timeout=10
         )
-
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return None
+        return None, summary
+    if status_result.returncode != 0:
+        return None, summary
+
+    head_oid = b""
+    change_records = []
+    records = iter(status_result.stdout.split(b"\0"))
+    for record in records:
+        if record.startswith(b"# "):
+            # Other headers (branch name, upstream ahead/behind) aren't
+            # local progress
+            if record.startswith(b"# branch.oid "):
+                head_oid = record[len(b"# branch.oid "):]
+            continue
+        if not record:
+            continue
+        change_records.append(record)
+
+        kind = record[:1]
+        if kind == b"?":
+            summary["untracked"].append(os.fsdecode(record[2:]))
+            continue
+        if kind not in _STATUS_PATH_FIELD:
+            continue  # "!" ignored entries
+
+        index_status, work_status = record[2:3], record[3:4]
+        filename = os.fsdecode(record.split(b" ", _STATUS_PATH_FIELD[kind])[-1])
+        if kind == b"2":
+            change_records.append(next(records, b""))  # Rename/copy source path
+
+        if index_status != b".":
+            summary["staged"].append(filename)
+        elif work_status != b".":
+            summary["unstaged"].append(filename)
+
+    if not head_oid or head_oid == b"(initial)":
+        return None, summary  # No commits yet
+
+    status_output = b"\0".join(change_records)
+    snapshot = GitSnapshot(
+        status_hash=_short_hash(status_output),
+        head_hash=head_oid[:12].decode("ascii"),  # Short hash for display
+        combined_hash=_short_hash(status_output + b"\n" + head_oid),
+    )
+    return snapshot, summary
+
+
+def take_snapshot(worktree: Path) -> Optional[GitSnapshot]:
+    """
+    Take a snapshot of the current git state.
+
+    Args:
+        worktree: Path to the git worktree
+
+    Returns:
+        GitSnapshot or None if not a git repo
+    """
+    return snapshot_and_summary(worktree)[0]
 
 
 def has_progress(before: Optional[GitSnapshot], after: Optional[GitSnapshot]) -> bool:
@@ -102,18 +172,10 @@ def get_recent_commits(worktree: Path, count: int = 3) -> list[str]:
     Returns:
         List of commit messages (one-line format)
     """
-    if isinstance(worktree, str):
-        worktree = Path(worktree).expanduser()
-
     try:
-        result = subprocess.run(
-            ["git", "-C", str(worktree), "log", f"-{count}", "--oneline"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        result = _git(worktree, "log", f"-{count}", "--oneline", timeout=5)
         if result.returncode == 0:
-            return result.stdout.strip().split("\n")
+            return result.stdout.decode("utf-8", "replace").strip().split("\n")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
@@ -131,9 +193,6 @@ def get_diff_summary(worktree: Path, since_commit: str = "HEAD~1") -> dict:
     Returns:
         dict with files_changed, insertions, deletions, file_list
     """
-    if isinstance(worktree, str):
-        worktree = Path(worktree).expanduser()
-
     result = {
         "files_changed": 0,
         "insertions": 0,
@@ -142,36 +201,26 @@ def get_diff_summary(worktree: Path, since_commit: str = "HEAD~1") -> dict:
     }
 
     try:
-        # Get diff stat
-        stat_result = subprocess.run(
-            ["git", "-C", str(worktree), "diff", "--stat", "--stat-width=80", since_commit],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if stat_result.returncode == 0 and stat_result.stdout.strip():
-            lines = stat_result.stdout.strip().split("\n")
-            # Last line is summary: " 3 files changed, 10 insertions(+), 2 deletions(-)"
-            if lines:
-                for line in lines[:-1]:  # All but last line are file changes
-                    parts = line.strip().split("|")
-                    if len(parts) >= 1:
-                        filename = parts[0].strip()
-                        if filename:
-                            result["file_list"].append(filename)
-
-                # Parse summary line
-                summary = lines[-1]
-                import re
-                files_match = re.search(r"(\d+) files? changed", summary)
-                ins_match = re.search(r"(\d+) insertions?", summary)
-                del_match = re.search(r"(\d+) deletions?", summary)
-                if files_match:
-                    result["files_changed"] = int(files_match.group(1))
-                if ins_match:
-                    result["insertions"] = int(ins_match.group(1))
-                if del_match:
-                    result["deletions"] = int(del_match.group(1))
+        # numstat -z: "ins\tdel\tpath" per file; renames leave path empty
+        # and follow with the source and destination as separate records
+        diff_result = _git(worktree, "diff", "--numstat", "-z", since_commit, timeout=10)
+        if diff_result.returncode == 0:
+            records = iter(diff_result.stdout.split(b"\0"))
+            for record in records:
+                if not record:
+                    continue
+                insertions, deletions, path = record.split(b"\t", 2)
+                if not path:
+                    next(records, None)  # Rename source
+                    path = next(records, b"")
+
+                result["files_changed"] += 1
+                # Binary files report "-" for both counts
+                if insertions != b"-":
+                    result["insertions"] += int(insertions)
+                if deletions != b"-":
+                    result["deletions"] += int(deletions)
+                result["file_list"].append(os.fsdecode(path))
 
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
@@ -189,38 +238,4 @@ def get_uncommitted_summary(worktree: Path) -> dict:
     Returns:
         dict with staged, unstaged, untracked counts and file lists
     """
-    if isinstance(worktree, str):
-        worktree = Path(worktree).expanduser()
-
-    result = {
-        "staged": [],
-        "unstaged": [],
-        "untracked": [],
-    }
-
-    try:
-        status_result = subprocess.run(
-            ["git", "-C", str(worktree), "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if status_result.returncode == 0:
-            for line in status_result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                index_status = line[0] if len(line) > 0 else " "
-                work_status = line[1] if len(line) > 1 else " "
-                filename = line[3:] if len(line) > 3 else ""
-
-                if index_status == "?":
-                    result["untracked"].append(filename)
-                elif index_status != " ":
-                    result["staged"].append(filename)
-                elif work_status != " ":
-                    result["unstaged"].append(filename)
-
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-
-    return result
+    return snapshot_and_summary(worktree)[1]
@@ -0,0 +1,189 @@
+"""Client-side rate limiting for OpenRouter calls.
+
+A council fans out one request per model per phase, which is enough to trip
+per-minute request/token ceilings on low provider tiers. OpenRouterClient
+caps in-flight requests with a semaphore and paces token spend with a
+rolling one-minute TokenBudgetTracker, so bursts queue locally instead of
+coming back as 429s. Each request reserves its estimated tokens before it
+is sent, so a simultaneous fan-out is paced rather than released at once.
+
+Both limits are set per process from the environment:
+COUNCIL_MAX_CONCURRENT (default 5) and COUNCIL_TPM_LIMIT (default 40000;
+0 turns token pacing off). Raise them to match your OpenRouter account.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_CONCURRENT = 5
+DEFAULT_TPM_LIMIT = 40_000
+
+# Rough prompt-size heuristic; only used to pace requests, never billed
+CHARS_PER_TOKEN = 4
+
+
+def max_concurrent_from_env() -> int:
+    """Concurrent request cap from COUNCIL_MAX_CONCURRENT (at least 1)."""
+    try:
+        value = int(os.environ.get("COUNCIL_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT
+    return value if value >= 1 else DEFAULT_MAX_CONCURRENT
+
+
+def tpm_limit_from_env() -> int:
+    """Tokens-per-minute budget from COUNCIL_TPM_LIMIT (0 disables pacing)."""
+    try:
+        return max(0, int(os.environ.get("COUNCIL_TPM_LIMIT", DEFAULT_TPM_LIMIT)))
+    except ValueError:
+        return DEFAULT_TPM_LIMIT
+
+
+def estimate_tokens(messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> int:
+    """Estimate the tokens a request will consume (prompt plus output cap)."""
+    chars = sum(len(m["content"]) for m in messages)
+    return chars // CHARS_PER_TOKEN + (max_tokens or 0)
+
+
+class Reservation:
+    """Tokens held in a TokenBudgetTracker for one in-flight request.
+
+    Call settle() with the actual usage once the request completes, or
+    release() if it fails. Only the first of the two takes effect.
+    """
+
+    def __init__(self, tracker: "TokenBudgetTracker", entry: Optional[List[float]]):
+        self._tracker = tracker
+        self._entry = entry
+
+    def settle(self, tokens: int) -> None:
+        """Replace the estimate with the tokens actually spent."""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._tracker._replace(entry, tokens)
+
+    def release(self) -> None:
+        """Return the reserved tokens to the budget."""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._tracker._replace(entry, None)
+
+
+class TokenBudgetTracker:
+    """Rolling-window tokens-per-minute budget.
+
+    Usage is kept as [timestamp, tokens] entries; entries older than the
+    window drop out. Callers reserve their estimate before sending a
+    request (wait_for_budget) and settle it with actual usage once it
+    completes, so concurrent requests see each other's spend.
+    """
+
+    def __init__(
+        self,
+        tpm_limit: int = DEFAULT_TPM_LIMIT,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize tracker.
+
+        Args:
+            tpm_limit: Tokens allowed per window (0 disables pacing)
+            window: Window length in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.tpm_limit = tpm_limit
+        self.window = window
+        self._clock = clock
+        self._events: Deque[List[float]] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Drop usage that has aged out of the window."""
+        events = self._events
+        while events and events[0][0] <= now - self.window:
+            events.popleft()
+
+    def used(self) -> int:
+        """Tokens recorded or reserved within the current window."""
+        with self._lock:
+            self._prune(self._clock())
+            return sum(tokens for _, tokens in self._events)
+
+    def _delay_locked(self, now: float, tokens: int) -> float:
+        """delay_for() body; caller holds the lock."""
+        self._prune(now)
+        events = self._events
+        used = sum(t for _, t in events)
+        if used + tokens <= self.tpm_limit or not events:
+            return 0.0
+        # Find the oldest entry whose expiry frees enough budget
+        for ts, t in events:
+            used -= t
+            if used + tokens <= self.tpm_limit:
+                return ts + self.window - now
+        return events[-1][0] + self.window - now
+
+    def delay_for(self, tokens: int) -> float:
+        """Seconds until `tokens` fit in the budget (0.0 if they fit now).
+
+        A single request larger than the whole budget is allowed once
+        nothing else is recorded or reserved in the window, so oversized
+        prompts still make progress.
+        """
+        if self.tpm_limit <= 0:
+            return 0.0
+
+        with self._lock:
+            return self._delay_locked(self._clock(), tokens)
+
+    def _try_reserve(self, tokens: int) -> Tuple[float, Optional[Reservation]]:
+        """Reserve `tokens` if they fit now; otherwise return the wait."""
+        if self.tpm_limit <= 0:
+            return 0.0, Reservation(self, None)
+
+        with self._lock:
+            now = self._clock()
+            delay = self._delay_locked(now, tokens)
+            if delay > 0:
+                return delay, None
+            entry = [now, tokens]
+            self._events.append(entry)
+            return 0.0, Reservation(self, entry)
+
+    def wait_for_budget(self, tokens: int) -> Reservation:
+        """Block until `tokens` fit in the budget, then reserve them."""
+        delay, reservation = self._try_reserve(tokens)
+        while reservation is None:
+            time.sleep(delay)
+            delay, reservation = self._try_reserve(tokens)
+        return reservation
+
+    async def wait_for_budget_async(self, tokens: int) -> Reservation:
+        """Wait, without blocking the event loop, then reserve `tokens`."""
+        delay, reservation = self._try_reserve(tokens)
+        while reservation is None:
+            await asyncio.sleep(delay)
+            delay, reservation = self._try_reserve(tokens)
+        return reservation
+
+    def record_usage(self, tokens: int) -> None:
+        """Record tokens spent by a request that held no reservation."""
+        if self.tpm_limit <= 0:
+            return
+        with self._lock:
+            self._events.append([self._clock(), tokens])
+
+    def _replace(self, entry: List[float], tokens: Optional[int]) -> None:
+        """Drop a reserved entry, re-recording it as `tokens` spent now."""
+        with self._lock:
+            events = self._events
+            for i, event in enumerate(events):
+                if event is entry:
+                    del events[i]
+                    break
+            if tokens is not None:
+                events.append([self._clock(), tokens])
@@ -0,0 +1,70 @@
+"""Tests for bootstrapping Claude Code files from a plan."""
+
+import pytest
+
+from council import bootstrap
+from council.bootstrap import generate_all_bootstrap
+from council.client import CompletionResult
+
+
+RESPONSE = """<INVARIANTS>
+## Security
+- Never log tokens
+</INVARIANTS>
+<CLAUDE_MD>
+# Project: Todo
+</CLAUDE_MD>
+<STATE_MD>
+# STATE.md
+</STATE_MD>"""
+
+
+class StubClient:
+    """Records prompts and answers with a canned completion."""
+
+    def __init__(self, content):
+        self.content = content
+        self.prompts = []
+
+    def complete(self, messages, model, timeout):
+        self.prompts.append(messages[-1].content)
+        return CompletionResult(content=self.content, model=model)
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Install a StubClient as bootstrap's client; set .content per test."""
+    client = StubClient(RESPONSE)
+    monkeypatch.setattr(bootstrap, "get_client", lambda: client)
+    return client
+
+
+class TestGenerateAllBootstrap:
+    """Test the single-call bootstrap generator."""
+
+    def test_extracts_each_section(self, stub):
+        invariants, claude_md, state_md = generate_all_bootstrap("Build a todo app.")
+
+        assert invariants == "## Security\n- Never log tokens\n"
+        assert claude_md == "# Project: Todo\n"
+        assert state_md == "# STATE.md\n"
+
+    @pytest.mark.parametrize("broken", [
+        RESPONSE.replace("<STATE_MD>\n# STATE.md\n</STATE_MD>", ""),
+        RESPONSE.replace("# Project: Todo", "  "),
+    ])
+    def test_missing_or_empty_section_returns_none(self, stub, broken):
+        stub.content = broken
+
+        assert generate_all_bootstrap("Build a todo app.") is None
+
+    def test_prompt_keeps_per_file_templates(self, stub):
+        generate_all_bootstrap("Build a todo app.")
+        prompt = stub.prompts[0]
+
+        assert "Build a todo app." in prompt
+        assert "```bash" in prompt
+        assert "| Command | What |" in prompt
+        assert "| Decision | Why |" in prompt
+        assert "no wrapper fences" in prompt
+        assert "{" not in prompt
@@ -0,0 +1,85 @@
+"""Tests for the on-disk completion cache."""
+
+import json
+
+import pytest
+
+from council import cache
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a planner."},
+    {"role": "user", "content": "Plan a todo app."},
+]
+RESPONSE = {"content": "1. Do it", "model": "m", "usage": {"total_tokens": 5}}
+
+
+class TestCacheKey:
+    """Test request hashing."""
+
+    def test_same_request_same_key(self):
+        assert cache.cache_key("m", MESSAGES, 100) == cache.cache_key("m", list(MESSAGES), 100)
+
+    @pytest.mark.parametrize("model, messages, max_tokens", [
+        ("other", MESSAGES, 100),
+        ("m", MESSAGES[:1], 100),
+        ("m", MESSAGES, None),
+        ("m", [MESSAGES[0], {"role": "user", "content": "Plan a chat app."}], 100),
+    ])
+    def test_any_change_changes_key(self, model, messages, max_tokens):
+        assert cache.cache_key(model, messages, max_tokens) != cache.cache_key("m", MESSAGES, 100)
+
+
+class TestCacheStore:
+    """Test get/put round trips."""
+
+    def test_miss_then_hit(self, tmp_path):
+        key = cache.cache_key("m", MESSAGES)
+        assert cache.get(key, cache_dir=tmp_path) is None
+
+        cache.put(key, "m", RESPONSE, ttl=60, cache_dir=tmp_path)
+
+        assert cache.get(key, cache_dir=tmp_path) == RESPONSE
+        entry = json.loads((tmp_path / f"{key}.json").read_text())
+        assert entry["inputHash"] == key
+        assert entry["modelId"] == "m"
+        assert entry["expiresAt"] > entry["createdAt"]
+
+    def test_expired_entry_is_removed(self, tmp_path):
+        key = cache.cache_key("m", MESSAGES)
+        cache.put(key, "m", RESPONSE, ttl=-1, cache_dir=tmp_path)
+
+        assert cache.get(key, cache_dir=tmp_path) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        key = cache.cache_key("m", MESSAGES)
+        (tmp_path / f"{key}.json").write_text("{not json")
+
+        assert cache.get(key, cache_dir=tmp_path) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_unwritable_dir_is_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache.put("k", "m", RESPONSE, cache_dir=blocker / "cache")
+
+
+class TestCacheSettings:
+    """Test environment configuration."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("COUNCIL_CACHE", raising=False)
+        assert not cache.cache_enabled()
+
+    def test_enabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("COUNCIL_CACHE", "1")
+        assert cache.cache_enabled()
+
+    def test_ttl_from_env(self, monkeypatch):
+        monkeypatch.setenv("COUNCIL_CACHE_TTL", "30")
+        assert cache.cache_ttl() == 30
+
+    def test_bad_ttl_falls_back(self, monkeypatch):
+        monkeypatch.setenv("COUNCIL_CACHE_TTL", "soon")
+        assert cache.cache_ttl() == cache.DEFAULT_TTL
@@ -5,14 +5,19 @@ to test the full flow: git snapshot → has_progress() → streak increment →
 Current tests verify the logic patterns but don't exercise the actual code paths.
 """
 
+import os
 import pytest
+import subprocess
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 from council.dispatcher.simple import (
     Agent, Config, check_agents, MAX_NO_PROGRESS,
 )
-from council.dispatcher.gitwatch import GitSnapshot
+from council.dispatcher.gitwatch import (
+    GitSnapshot, has_progress, take_snapshot, snapshot_and_summary,
+    get_diff_summary, get_uncommitted_summary,
+)
 
 
 @pytest.fixture
@@ -150,3 +155,139 @@ class TestMaxNoProgressConstant:
     def test_max_no_progress_is_three(self):
         """Current value should be 3."""
         assert MAX_NO_PROGRESS == 3
+
+
+@pytest.fixture
+def git_worktree(tmp_path):
+    """Git repo with no commits yet."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+def _commit_all(repo: Path, message: str) -> None:
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], cwd=repo, check=True)
+
+
+class TestTakeSnapshot:
+    """Test git snapshots against a real repo."""
+
+    def test_not_a_repo(self, tmp_path):
+        assert take_snapshot(tmp_path) is None
+
+    def test_no_commits_yet(self, git_worktree):
+        assert take_snapshot(git_worktree) is None
+
+    def test_unchanged_repo_is_no_progress(self, git_worktree):
+        (git_worktree / "a.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+
+        before = take_snapshot(git_worktree)
+        after = take_snapshot(git_worktree)
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=git_worktree, capture_output=True, text=True
+        ).stdout.strip()
+        assert before.head_hash == head[:12]
+        assert not has_progress(before, after)
+
+    def test_edit_and_commit_are_progress(self, git_worktree):
+        (git_worktree / "a.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+        clean = take_snapshot(git_worktree)
+
+        (git_worktree / "a.txt").write_text("changed")
+        dirty = take_snapshot(git_worktree)
+        assert has_progress(clean, dirty)
+        assert dirty.head_hash == clean.head_hash
+
+        _commit_all(git_worktree, "change")
+        committed = take_snapshot(git_worktree)
+        assert has_progress(dirty, committed)
+        assert committed.head_hash != clean.head_hash
+
+    def test_accepts_tilde_path_string(self, git_worktree, monkeypatch):
+        (git_worktree / "a.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+        monkeypatch.setenv("HOME", str(git_worktree.parent))
+
+        assert take_snapshot(f"~/{git_worktree.name}") == take_snapshot(git_worktree)
+
+    def test_status_skips_optional_locks(self, git_worktree):
+        (git_worktree / "a.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+        (git_worktree / "a.txt").write_text("changed")
+
+        with patch("council.dispatcher.gitwatch.subprocess.run", wraps=subprocess.run) as run:
+            take_snapshot(git_worktree)
+
+        assert run.call_args.kwargs["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+
+
+class TestUncommittedSummary:
+    """Test staged/unstaged/untracked classification."""
+
+    def test_classifies_changes(self, git_worktree):
+        (git_worktree / "my notes.txt").write_text("a")
+        (git_worktree / "old.txt").write_text("old")
+        (git_worktree / "edit.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+
+        (git_worktree / "my notes.txt").write_text("changed")
+        subprocess.run(["git", "mv", "old.txt", "new.txt"], cwd=git_worktree, check=True)
+        (git_worktree / "edit.txt").write_text("changed")
+        subprocess.run(["git", "add", "edit.txt"], cwd=git_worktree, check=True)
+        (git_worktree / "fresh file.txt").write_text("new")
+
+        summary = get_uncommitted_summary(git_worktree)
+
+        assert sorted(summary["staged"]) == ["edit.txt", "new.txt"]
+        assert summary["unstaged"] == ["my notes.txt"]
+        assert summary["untracked"] == ["fresh file.txt"]
+
+    def test_non_utf8_filename(self, git_worktree):
+        (git_worktree / "a.txt").write_text("a")
+        _commit_all(git_worktree, "init")
+        odd_name = os.fsdecode(b"caf\xe9.txt")
+        (git_worktree / odd_name).write_text("x")
+
+        snapshot, summary = snapshot_and_summary(git_worktree)
+
+        assert snapshot is not None
+        assert summary["untracked"] == [odd_name]
+
+    def test_summary_without_commits(self, git_worktree):
+        (git_worktree / "a.txt").write_text("a")
+
+        snapshot, summary = snapshot_and_summary(git_worktree)
+
+        assert snapshot is None
+        assert summary["untracked"] == ["a.txt"]
+
+    def test_not_a_repo(self, tmp_path):
+        assert get_uncommitted_summary(tmp_path) == {
+            "staged": [], "unstaged": [], "untracked": [],
+        }
+
+
+class TestDiffSummary:
+    """Test per-commit diff totals."""
+
+    def test_counts_edits_renames_and_binaries(self, git_worktree):
+        (git_worktree / "a.txt").write_text("one\ntwo\n")
+        (git_worktree / "old name.txt").write_text("same\n" * 10)
+        _commit_all(git_worktree, "init")
+
+        (git_worktree / "a.txt").write_text("one\nthree\nfour\n")
+        (git_worktree / "old name.txt").rename(git_worktree / "new name.txt")
+        (git_worktree / "blob.bin").write_bytes(b"\0\1\2")
+        _commit_all(git_worktree, "change")
+
+        summary = get_diff_summary(git_worktree)
+
+        assert summary["files_changed"] == 3
+        assert summary["insertions"] == 2
+        assert summary["deletions"] == 1
+        assert sorted(summary["file_list"]) == ["a.txt", "blob.bin", "new name.txt"]
@@ -0,0 +1,185 @@
+"""Tests for the OpenRouter client's retry handling."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from council import client as client_module
+from council import ratelimit
+from council.client import Message, OpenRouterClient, OpenRouterError, get_client
+from council.ratelimit import TokenBudgetTracker
+
+
+MESSAGES = [Message(role="user", content="Plan a todo app.")]
+OK_BODY = {
+    "choices": [{"message": {"content": "1. Do it"}}],
+    "usage": {"total_tokens": 12},
+}
+
+
+def _response(status, headers=None):
+    return httpx.Response(status, headers=headers or {})
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Route the shared HTTP client through a scripted MockTransport.
+
+    Append responses to the returned list; each request pops the next one.
+    """
+    responses = []
+
+    def handler(request):
+        return responses.pop(0)
+
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(client_module, "_shared_http", http)
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    monkeypatch.delenv("COUNCIL_CACHE", raising=False)
+    yield responses
+    http.close()
+
+
+class TestShouldRetry:
+    """Test which responses are retried."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_transient_statuses_retry(self, status):
+        assert OpenRouterClient._should_retry(_response(status), attempt=0)
+
+    @pytest.mark.parametrize("status", [200, 400, 401, 404])
+    def test_other_statuses_do_not(self, status):
+        assert not OpenRouterClient._should_retry(_response(status), attempt=0)
+
+    def test_last_attempt_does_not_retry(self):
+        last = client_module._MAX_ATTEMPTS - 1
+        assert not OpenRouterClient._should_retry(_response(503), attempt=last)
+
+
+class TestRetryDelay:
+    """Test backoff timing."""
+
+    def test_exponential_without_retry_after(self):
+        delays = [OpenRouterClient._retry_delay(_response(503), n) for n in range(4)]
+        assert delays == [1.0, 2.0, 4.0, 8.0]
+
+    def test_numeric_retry_after(self):
+        response = _response(429, {"Retry-After": "7"})
+        assert OpenRouterClient._retry_delay(response, attempt=0) == 7.0
+
+    def test_date_retry_after_falls_back_to_backoff(self):
+        response = _response(429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        assert OpenRouterClient._retry_delay(response, attempt=2) == 4.0
+
+    def test_capped(self):
+        cap = client_module._MAX_RETRY_DELAY
+        assert OpenRouterClient._retry_delay(_response(429, {"Retry-After": "120"}), 0) == cap
+        assert OpenRouterClient._retry_delay(_response(503), attempt=10) == cap
+
+
+class TestCompleteRetries:
+    """Test complete() against scripted HTTP responses."""
+
+    def test_429_then_success(self, transport):
+        transport.extend([
+            _response(429, {"Retry-After": "1"}),
+            httpx.Response(200, json=OK_BODY),
+        ])
+
+        result = OpenRouterClient(api_key="k").complete(MESSAGES, model="m")
+
+        assert result.content == "1. Do it"
+        assert transport == []
+
+    def test_persistent_503_raises(self, transport):
+        transport.extend([_response(503)] * client_module._MAX_ATTEMPTS)
+
+        with pytest.raises(OpenRouterError, match="503"):
+            OpenRouterClient(api_key="k").complete(MESSAGES, model="m")
+        assert transport == []
+
+    def test_client_error_not_retried(self, transport):
+        transport.extend([_response(400), httpx.Response(200, json=OK_BODY)])
+
+        with pytest.raises(OpenRouterError):
+            OpenRouterClient(api_key="k").complete(MESSAGES, model="m")
+        assert len(transport) == 1
+
+    def test_stream_retries_before_first_chunk(self, transport):
+        sse = (
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        transport.extend([_response(503), httpx.Response(200, text=sse)])
+
+        chunks = list(OpenRouterClient(api_key="k").complete_stream(MESSAGES, model="m"))
+
+        assert chunks == ["Hel", "lo"]
+        assert transport == []
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenPacing:
+    """Test that concurrent requests are paced by the token budget."""
+
+    def test_concurrent_fan_out_is_paced(self, monkeypatch):
+        clock = FakeClock()
+        real_sleep = asyncio.sleep
+        sent_at = []
+
+        async def fake_sleep(seconds):
+            clock.now += seconds
+            await real_sleep(0)
+
+        async def handler(request):
+            sent_at.append(clock.now)
+            # Stay in flight so every call is pending at once
+            await real_sleep(0.01)
+            return httpx.Response(200, json=OK_BODY)
+
+        monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+        monkeypatch.delenv("COUNCIL_CACHE", raising=False)
+        client = OpenRouterClient(api_key="k")
+        client._tpm = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        client._async_http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        # ~90 tokens each against a 100 TPM budget
+        messages = [Message(role="user", content="x" * 360)]
+
+        async def fan_out():
+            try:
+                await asyncio.gather(
+                    *(client.complete_async(messages, model=f"m{i}") for i in range(4))
+                )
+            finally:
+                await client.aclose()
+
+        asyncio.run(fan_out())
+
+        assert sent_at == [1000.0, 1060.0, 1120.0, 1180.0]
+        # Every reservation was settled with the reported usage
+        assert {t for _, t in client._tpm._events} == {OK_BODY["usage"]["total_tokens"]}
+
+
+class TestGetClient:
+    """Test client construction from the environment."""
+
+    def test_rate_limits_from_env(self, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+        monkeypatch.setenv("COUNCIL_MAX_CONCURRENT", "9")
+        monkeypatch.setenv("COUNCIL_TPM_LIMIT", "0")
+
+        client = get_client()
+
+        assert client.max_concurrent == 9
+        assert client._tpm.tpm_limit == 0
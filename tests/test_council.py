@@ -0,0 +1,160 @@
+"""Tests for council orchestration helpers."""
+
+import asyncio
+
+from council.client import CompletionResult
+from council.council import (
+    _as_completed_quorum,
+    _critique_messages,
+    compress_drafts_async,
+    compress_threshold_from_env,
+)
+
+
+async def _member(model, delay, ok=True, cancelled=None):
+    """Fake council call: sleep, then return a canned outcome tuple."""
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        if cancelled is not None:
+            cancelled.append(model)
+        raise
+    return (model, object() if ok else None, None if ok else "boom")
+
+
+def _collect(calls, quorum, straggler_wait):
+    async def run():
+        return [model async for model, _, _ in _as_completed_quorum(
+            calls, quorum=quorum, straggler_wait=straggler_wait
+        )]
+    return asyncio.run(run())
+
+
+class TestAsCompletedQuorum:
+    """Test quorum-based collection of council member outcomes."""
+
+    def test_stragglers_cancelled_after_wait(self):
+        cancelled = []
+        calls = [
+            _member("a", 0.01),
+            _member("b", 0.02),
+            _member("slow", 5, cancelled=cancelled),
+        ]
+
+        seen = _collect(calls, quorum=2, straggler_wait=0.05)
+
+        assert seen == ["a", "b"]
+        assert cancelled == ["slow"]
+
+    def test_failures_do_not_count_toward_quorum(self):
+        calls = [
+            _member("a", 0.01),
+            _member("failed", 0.01, ok=False),
+            _member("late", 0.15),
+        ]
+
+        seen = _collect(calls, quorum=2, straggler_wait=0.01)
+
+        # Only one success before "late", so no straggler deadline was set
+        assert sorted(seen) == ["a", "failed", "late"]
+
+    def test_waits_for_everything_without_quorum(self):
+        calls = [
+            _member("x", 0.01, ok=False),
+            _member("y", 0.05, ok=False),
+            _member("z", 0.1),
+        ]
+
+        seen = _collect(calls, quorum=3, straggler_wait=0.0)
+
+        assert sorted(seen) == ["x", "y", "z"]
+
+    def test_late_arrival_within_wait_is_kept(self):
+        calls = [_member("a", 0.01), _member("b", 0.02), _member("c", 0.04)]
+
+        seen = _collect(calls, quorum=2, straggler_wait=1.0)
+
+        assert seen == ["a", "b", "c"]
+
+
+class StubClient:
+    """Records compression requests and answers with a short summary."""
+
+    def __init__(self, fail_on=()):
+        self.requests = []
+        self.fail_on = fail_on
+
+    async def complete_async(self, messages, model, timeout):
+        text = messages[-1].content
+        self.requests.append(text)
+        if text in self.fail_on:
+            raise RuntimeError("upstream down")
+        return CompletionResult(content=f"summary of {text[:1]}", model=model)
+
+
+class TestCompressDrafts:
+    """Test opt-in draft condensing for the critique phase."""
+
+    def test_disabled_by_zero_threshold(self):
+        client = StubClient()
+        drafts = {"a": "x" * 50_000}
+
+        result, condensed = asyncio.run(compress_drafts_async(client, drafts, threshold=0))
+
+        assert result == drafts and condensed == []
+        assert client.requests == []
+
+    def test_under_threshold_untouched(self):
+        client = StubClient()
+        drafts = {"a": "a" * 3000, "b": "b" * 3000}
+
+        result, condensed = asyncio.run(compress_drafts_async(client, drafts, threshold=8000))
+
+        assert result == drafts and condensed == []
+        assert client.requests == []
+
+    def test_only_drafts_over_their_share_condensed(self):
+        client = StubClient()
+        # 9000 chars total over a 8000 threshold; each draft's share is 4000
+        drafts = {"a": "a" * 6000, "b": "b" * 3000}
+
+        result, condensed = asyncio.run(compress_drafts_async(client, drafts, threshold=8000))
+
+        assert result == {"a": "summary of a", "b": "b" * 3000}
+        assert condensed == ["a"]
+        assert len(client.requests) == 1
+
+    def test_failed_summary_keeps_original(self):
+        long_a, long_b = "a" * 6000, "b" * 6000
+        client = StubClient(fail_on={long_b})
+
+        result, condensed = asyncio.run(
+            compress_drafts_async(client, {"a": long_a, "b": long_b}, threshold=8000)
+        )
+
+        assert result == {"a": "summary of a", "b": long_b}
+        assert condensed == ["a"]
+
+    def test_threshold_from_env(self, monkeypatch):
+        monkeypatch.delenv("COUNCIL_COMPRESS_THRESHOLD", raising=False)
+        assert compress_threshold_from_env() == 0
+        monkeypatch.setenv("COUNCIL_COMPRESS_THRESHOLD", "12000")
+        assert compress_threshold_from_env() == 12000
+
+
+class TestCritiqueMessages:
+    """Test how drafts are presented to critics."""
+
+    def test_condensed_drafts_labelled(self):
+        messages = _critique_messages({"a": "short", "b": "full"}, "Plan it", condensed=["a"])
+        content = messages[-1].content
+
+        assert "### Draft from a (condensed)" in content
+        assert "### Draft from b\n" in content
+        assert "were summarized by another model" in content
+
+    def test_no_note_without_condensing(self):
+        content = _critique_messages({"a": "x", "b": "y"}, "Plan it")[-1].content
+
+        assert "(condensed)" not in content
+        assert "summarized" not in content
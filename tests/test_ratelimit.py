@@ -0,0 +1,149 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+
+from council import ratelimit
+from council.ratelimit import TokenBudgetTracker, estimate_tokens
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestEstimateTokens:
+    """Test request size estimates."""
+
+    def test_counts_prompt_and_output_cap(self):
+        messages = [{"role": "user", "content": "x" * 400}]
+        assert estimate_tokens(messages) == 100
+        assert estimate_tokens(messages, max_tokens=50) == 150
+
+
+class TestTokenBudgetTracker:
+    """Test the rolling tokens-per-minute window."""
+
+    def test_fits_within_budget(self):
+        clock = FakeClock()
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        tracker.record_usage(60)
+        assert tracker.delay_for(40) == 0.0
+
+    def test_waits_for_oldest_usage_to_expire(self):
+        clock = FakeClock()
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        tracker.record_usage(60)
+        clock.sleep(10)
+        tracker.record_usage(30)
+        clock.sleep(5)
+        # Needs the first entry (recorded 15s ago) to age out
+        assert tracker.delay_for(20) == 45.0
+
+    def test_usage_ages_out_of_window(self):
+        clock = FakeClock()
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        tracker.record_usage(90)
+        assert tracker.used() == 90
+        clock.sleep(60)
+        assert tracker.used() == 0
+
+    def test_oversized_request_allowed_on_empty_window(self):
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=FakeClock())
+        assert tracker.delay_for(500) == 0.0
+
+    def test_zero_limit_disables_pacing(self):
+        tracker = TokenBudgetTracker(tpm_limit=0, clock=FakeClock())
+        tracker.record_usage(10**6)
+        assert tracker.delay_for(10**6) == 0.0
+
+    def test_wait_for_budget_sleeps_until_fit(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        tracker.record_usage(80)
+
+        tracker.wait_for_budget(50)
+
+        assert clock.now == 1060.0
+
+    def test_wait_for_budget_async(self, monkeypatch):
+        clock = FakeClock()
+
+        async def fake_sleep(seconds):
+            clock.sleep(seconds)
+
+        monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        tracker.record_usage(80)
+
+        asyncio.run(tracker.wait_for_budget_async(50))
+
+        assert clock.now == 1060.0
+
+
+class TestReservations:
+    """Test budget reserved by in-flight requests."""
+
+    def test_reservation_counts_before_completion(self):
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=FakeClock())
+        tracker.wait_for_budget(90)
+        assert tracker.used() == 90
+        assert tracker.delay_for(90) == 60.0
+
+    def test_settle_replaces_estimate(self):
+        clock = FakeClock()
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=clock)
+        reservation = tracker.wait_for_budget(90)
+        clock.sleep(5)
+
+        reservation.settle(12)
+        reservation.release()
+
+        assert tracker.used() == 12
+        # Re-recorded at completion time, so it ages out from there
+        clock.sleep(58)
+        assert tracker.used() == 12
+
+    def test_release_frees_budget(self):
+        tracker = TokenBudgetTracker(tpm_limit=100, clock=FakeClock())
+        reservation = tracker.wait_for_budget(90)
+
+        reservation.release()
+
+        assert tracker.used() == 0
+        assert tracker.delay_for(90) == 0.0
+
+    def test_unlimited_reserves_nothing(self):
+        tracker = TokenBudgetTracker(tpm_limit=0, clock=FakeClock())
+        tracker.wait_for_budget(10**6).settle(10**6)
+        assert tracker.used() == 0
+
+
+class TestEnvLimits:
+    """Test limits read from the environment."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("COUNCIL_MAX_CONCURRENT", raising=False)
+        monkeypatch.delenv("COUNCIL_TPM_LIMIT", raising=False)
+        assert ratelimit.max_concurrent_from_env() == ratelimit.DEFAULT_MAX_CONCURRENT
+        assert ratelimit.tpm_limit_from_env() == ratelimit.DEFAULT_TPM_LIMIT
+
+    def test_overrides(self, monkeypatch):
+        monkeypatch.setenv("COUNCIL_MAX_CONCURRENT", "12")
+        monkeypatch.setenv("COUNCIL_TPM_LIMIT", "0")
+        assert ratelimit.max_concurrent_from_env() == 12
+        assert ratelimit.tpm_limit_from_env() == 0
+
+    def test_invalid_values_fall_back(self, monkeypatch):
+        monkeypatch.setenv("COUNCIL_MAX_CONCURRENT", "0")
+        monkeypatch.setenv("COUNCIL_TPM_LIMIT", "lots")
+        assert ratelimit.max_concurrent_from_env() == ratelimit.DEFAULT_MAX_CONCURRENT
+        assert ratelimit.tpm_limit_from_env() == ratelimit.DEFAULT_TPM_LIMIT